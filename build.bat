@@ -28,6 +28,15 @@ if exist build rmdir /s /q build
 if exist dist rmdir /s /q dist
 if exist automation-tools.spec del /q automation-tools.spec
 
+REM Convert Designer .ui files to Python modules
+python scripts\build_uis.py
+if errorlevel 1 (
+    echo.
+    echo UI conversion failed!
+    pause
+    exit /b 1
+)
+
 REM Run PyInstaller
 pyinstaller build.spec
 
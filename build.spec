@@ -17,7 +17,9 @@ def collect_tool_datas() -> list[tuple[str, str]]:
     datas: list[tuple[str, str]] = []
     patterns = [
         'tools/*/ui/*.ui',
+        'tools/*/ui/*_ui.py',  # scripts/build_uis.py로 생성 (load_ui_file이 우선 사용)
         'tools/*/constants.json',
+        'tools/*/tool.toml',  # 도구 메타데이터 (tools/__init__.py에서 읽음)
     ]
 
     for pattern in patterns:
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import sys
+import threading
+import weakref
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -20,6 +22,25 @@ from PySide6.QtCore import Qt
 import tools
 from tools.common.log_utils import get_tool_logger
 
+# 도구 버튼 스타일 (버튼마다 설정하지 않고 부모 위젯에 한 번만 적용)
+_TOOL_BUTTON_QSS = """
+    QPushButton#toolButton {
+        font-size: 14px;
+        padding: 15px;
+        text-align: center;
+        border: 2px solid #ddd;
+        border-radius: 8px;
+        background-color: #f5f5f5;
+    }
+    QPushButton#toolButton:hover {
+        background-color: #e0e0e0;
+        border-color: #0078d4;
+    }
+    QPushButton#toolButton:pressed {
+        background-color: #d0d0d0;
+    }
+"""
+
 
 class MainWindow(QMainWindow):
     """메인 GUI - 모든 도구를 선택할 수 있는 홈 화면"""
@@ -28,7 +49,8 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.logger = get_tool_logger("main_gui")
         self.setWindowTitle("업무 자동화 도구")
-        self._open_windows: list[QWidget] = []  # 열린 도구 윈도우 추적
+        # 열린 도구 윈도우 추적 (닫혀서 삭제된 윈도우는 자동으로 빠짐)
+        self._open_windows: weakref.WeakSet[QWidget] = weakref.WeakSet()
         self.logger.info("MainWindow initialized")
         self._build_ui()
     
@@ -57,6 +79,7 @@ class MainWindow(QMainWindow):
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         
         tools_widget = QWidget()
+        tools_widget.setStyleSheet(_TOOL_BUTTON_QSS)
         tools_layout = QGridLayout(tools_widget)
         tools_layout.setSpacing(15)
         
@@ -64,8 +87,6 @@ class MainWindow(QMainWindow):
         registered_tools = tools.get_registered_tools()
         self.logger.debug("Registered tools: %s", list(registered_tools.keys()) if registered_tools else [])
         
-        row = 0  # row 초기화 (도구가 없을 때를 대비)
-        col = 0
         cols_per_row = 3  # 한 줄에 3개씩 배치
         
         if not registered_tools:
@@ -73,18 +94,22 @@ class MainWindow(QMainWindow):
             no_tools_label = QLabel("등록된 도구가 없습니다.")
             no_tools_label.setAlignment(Qt.AlignCenter)
             tools_layout.addWidget(no_tools_label, 0, 0)
+            rows_needed = 1
         else:
-            for tool_id, tool_info in registered_tools.items():
-                self.logger.debug("Creating button for tool: %s (%s)", tool_id, tool_info.name)
-                btn = self._create_tool_button(tool_id, tool_info)
-                tools_layout.addWidget(btn, row, col)
-                
-                col += 1
-                if col >= cols_per_row:
-                    col = 0
-                    row += 1
+            # 버튼 추가 중에는 화면 갱신을 멈추고 마지막에 한 번만 레이아웃 계산
+            tools_widget.setUpdatesEnabled(False)
+            try:
+                for i, (tool_id, tool_info) in enumerate(registered_tools.items()):
+                    self.logger.debug("Creating button for tool: %s (%s)", tool_id, tool_info.name)
+                    btn = self._create_tool_button(tool_id, tool_info)
+                    row, col = divmod(i, cols_per_row)
+                    tools_layout.addWidget(btn, row, col)
+            finally:
+                tools_widget.setUpdatesEnabled(True)
+            rows_needed = (len(registered_tools) + cols_per_row - 1) // cols_per_row
         
-        tools_layout.setRowStretch(row + 1, 1)
+        # 버튼 아래 남는 공간은 빈 행이 차지
+        tools_layout.setRowStretch(rows_needed, 1)
         tools_widget.setLayout(tools_layout)
         scroll.setWidget(tools_widget)
         
@@ -93,26 +118,10 @@ class MainWindow(QMainWindow):
     def _create_tool_button(self, tool_id: str, tool_info: tools.ToolInfo) -> QPushButton:
         """도구 버튼 생성"""
         btn = QPushButton()
+        btn.setObjectName("toolButton")  # 스타일은 tools_widget의 _TOOL_BUTTON_QSS에서 적용
         btn.setText(f"{tool_info.name}\n\n{tool_info.description}")
         btn.setMinimumHeight(120)
         btn.setMinimumWidth(200)
-        btn.setStyleSheet("""
-            QPushButton {
-                font-size: 14px;
-                padding: 15px;
-                text-align: center;
-                border: 2px solid #ddd;
-                border-radius: 8px;
-                background-color: #f5f5f5;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-                border-color: #0078d4;
-            }
-            QPushButton:pressed {
-                background-color: #d0d0d0;
-            }
-        """)
         
         def on_click():
             self._open_tool(tool_id)
@@ -140,8 +149,9 @@ class MainWindow(QMainWindow):
             # QMainWindow인 경우 show() 호출
             if isinstance(widget, QMainWindow):
                 self.logger.debug("Widget is QMainWindow, showing directly")
+                widget.setAttribute(Qt.WA_DeleteOnClose)  # 닫으면 C++ 객체까지 해제
                 widget.show()
-                self._open_windows.append(widget)
+                self._open_windows.add(widget)
                 self.logger.info("Tool window opened successfully: %s", tool_id)
             else:
                 # QWidget인 경우 QMainWindow로 감싸서 표시
@@ -150,8 +160,9 @@ class MainWindow(QMainWindow):
                 window.setWindowTitle(widget.windowTitle() if hasattr(widget, 'windowTitle') else tool_id)
                 window.setCentralWidget(widget)
                 window.resize(800, 600)
+                window.setAttribute(Qt.WA_DeleteOnClose)  # 닫으면 C++ 객체까지 해제
                 window.show()
-                self._open_windows.append(window)
+                self._open_windows.add(window)
                 self.logger.info("Tool window opened successfully (wrapped): %s", tool_id)
         except Exception as e:
             self.logger.error("Exception while opening tool %s: %s", tool_id, str(e), exc_info=True)
@@ -179,6 +190,10 @@ def main() -> None:
         window.show()
         logger.info("MainWindow shown")
         
+        # 도구 모듈을 백그라운드에서 미리 import (첫 클릭 대기 시간 제거)
+        # 위젯 생성은 메인 스레드에서만 하므로 import만 수행
+        threading.Thread(target=tools.preload_tool_modules, name="tool-preload", daemon=True).start()
+        
         sys.exit(app.exec())
     except Exception as e:
         logger.error("Fatal error in main: %s", str(e), exc_info=True)
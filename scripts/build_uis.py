@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Designer .ui 파일을 Python 모듈로 변환 (빌드 전 실행)
+
+tools/*/ui/*.ui 를 pyside6-uic로 변환하여 같은 폴더에 *_ui.py 로 저장합니다.
+load_ui_file()은 최신 *_ui.py가 있으면 QUiLoader 대신 이를 사용합니다.
+
+사용법:
+    python scripts/build_uis.py          # 변경된 .ui만 변환
+    python scripts/build_uis.py --force  # 모두 다시 변환
+"""
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def build_uis(force: bool = False) -> int:
+    """모든 도구의 .ui 파일 변환, 변환한 파일 개수 반환"""
+    built = 0
+    for ui_file in sorted(PROJECT_ROOT.glob("tools/*/ui/*.ui")):
+        py_file = ui_file.with_name(f"{ui_file.stem}_ui.py")
+        if not force and py_file.exists() and py_file.stat().st_mtime >= ui_file.stat().st_mtime:
+            continue
+        print(f"[uic] {ui_file.relative_to(PROJECT_ROOT)} -> {py_file.name}")
+        subprocess.run(["pyside6-uic", str(ui_file), "-o", str(py_file)], check=True)
+        built += 1
+    return built
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=".ui 파일을 Python 모듈로 변환")
+    parser.add_argument('--force', action='store_true', help='변경 여부와 관계없이 모두 변환')
+    args = parser.parse_args()
+    
+    try:
+        count = build_uis(force=args.force)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(f"{count} UI file(s) converted")
@@ -1,12 +1,23 @@
 """업무 자동화 도구 모음"""
 from __future__ import annotations
 
+import importlib
+import importlib.util
+import logging
 import sys
-from typing import Protocol
-from PySide6.QtWidgets import QWidget
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python 3.10 이하는 같은 API의 tomli 사용
+    import tomli as tomllib
 
 from tools.common.log_utils import get_tool_logger
 
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QWidget
+
 
 class ToolInfo:
     """도구 정보"""
@@ -29,11 +40,43 @@ class BaseTool(Protocol):
 
 
 # 도구 등록 딕셔너리
-_registered_tools: dict[str, tuple[ToolInfo, type[BaseTool]]] = {}
+# tool_class 자리에는 클래스 또는 "module:attr" 형태의 import 문자열이 올 수 있음
+# (문자열은 create_tool_widget() 호출 시점에 import 후 클래스로 교체됨)
+_registered_tools: dict[str, tuple[ToolInfo, type[BaseTool] | str]] = {}
+
+# 외부 패키지가 도구를 선언하는 entry point 그룹
+# (pyproject.toml: [project.entry-points."automation_tools.tools"] my_tool = "my_pkg.tool:MyTool")
+_ENTRY_POINT_GROUP = "automation_tools.tools"
+
+# 지연 노출할 도구 클래스 (tools.RenamerTool 등) -> import 문자열
+_LAZY_ATTRS: dict[str, str] = {
+    "RenamerTool": "tools.renamer:RenamerTool",
+    "FolderCreatorTool": "tools.folder_creator:FolderCreatorTool",
+}
+
+
+def _resolve_spec(spec: str):
+    """"module:attr" 형태의 import 문자열을 실제 객체로 변환"""
+    mod_name, attr = spec.split(":")
+    return getattr(importlib.import_module(mod_name), attr)
+
 
+def __getattr__(name: str):
+    """도구 클래스를 실제 접근 시점에만 import (PEP 562)"""
+    spec = _LAZY_ATTRS.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = _resolve_spec(spec)
+    globals()[name] = value
+    return value
 
-def register_tool(tool_id: str, tool_info: ToolInfo, tool_class: type[BaseTool]):
-    """도구를 등록"""
+
+def register_tool(tool_id: str, tool_info: ToolInfo, tool_class: type[BaseTool] | str):
+    """도구를 등록
+
+    tool_class에 "tools.my_tool:MyTool" 형태의 문자열을 넘기면
+    도구 모듈은 실제로 열릴 때까지 import되지 않습니다.
+    """
     _registered_tools[tool_id] = (tool_info, tool_class)
 
 
@@ -42,65 +85,132 @@ def get_registered_tools() -> dict[str, ToolInfo]:
     return {tool_id: info for tool_id, (info, _) in _registered_tools.items()}
 
 
+def get_tool_info(tool_id: str) -> ToolInfo:
+    """tool.toml에서 등록된 도구 정보 반환 (도구 패키지의 *_INFO는 이 값을 그대로 사용)"""
+    return _registered_tools[tool_id][0]
+
+
 def create_tool_widget(tool_id: str, parent: QWidget | None = None) -> QWidget | None:
     """도구 ID로 GUI 위젯 생성"""
     logger = get_tool_logger("tools")
-    logger.debug("create_tool_widget called: tool_id=%s, parent=%s", tool_id, parent)
-    logger.debug("Registered tools: %s", list(_registered_tools.keys()))
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("create_tool_widget called: tool_id=%s, parent=%s", tool_id, parent)
+        logger.debug("Registered tools: %s", list(_registered_tools.keys()))
     
     if tool_id not in _registered_tools:
         logger.error("Tool not found in registered tools: %s", tool_id)
         return None
     
     try:
-        _, tool_class = _registered_tools[tool_id]
-        logger.debug("Tool class: %s", tool_class)
-        logger.debug("Instantiating tool class")
+        tool_info, tool_class = _registered_tools[tool_id]
+        if isinstance(tool_class, str):
+            logger.debug("Resolving tool class: %s", tool_class)
+            tool_class = _resolve_spec(tool_class)
+            _registered_tools[tool_id] = (tool_info, tool_class)
         tool_instance = tool_class()
-        logger.debug("Tool instance created: %s", tool_instance)
-        logger.debug("Calling create_widget(parent=%s)", parent)
         widget = tool_instance.create_widget(parent)
-        logger.debug("create_widget returned: %s (type: %s)", widget, type(widget).__name__ if widget else None)
+        if debug:
+            logger.debug("create_widget returned: %s (type: %s)", widget, type(widget).__name__ if widget else None)
         return widget
     except Exception as e:
         logger.error("Exception while creating tool widget for %s: %s", tool_id, str(e), exc_info=True)
         raise
 
 
+def preload_tool_modules() -> None:
+    """등록된 도구의 모듈(및 gui 하위 모듈)을 미리 import
+
+    메인 윈도우 표시 후 백그라운드 스레드에서 호출하여 첫 클릭 시
+    import 대기 시간을 없애기 위한 용도입니다. 위젯 생성은 하지 않으므로
+    GUI 스레드 밖에서 호출해도 안전합니다. 실패는 무시합니다
+    (실제 열 때 create_tool_widget에서 오류가 보고됨).
+    """
+    logger = get_tool_logger("tools")
+    for tool_id, (_, tool_class) in list(_registered_tools.items()):
+        mod_name = tool_class.split(":")[0] if isinstance(tool_class, str) else tool_class.__module__
+        for name in (mod_name, f"{mod_name}.gui"):
+            try:
+                if importlib.util.find_spec(name) is not None:
+                    importlib.import_module(name)
+            except Exception as e:
+                logger.debug("Preload failed for %s (%s): %s", tool_id, name, str(e))
+                break
+
+
+def _load_tool_manifests(logger: logging.Logger) -> list[tuple[str, dict[str, str | None], str, int]]:
+    """tools/*/tool.toml 매니페스트 읽기 (도구 이름/설명/진입점/순서의 유일한 출처)
+
+    Returns:
+        (tool_id, ToolInfo 인자, import 문자열, 표시 순서) 리스트 (표시 순서대로 정렬)
+    """
+    tools_dir = Path(__file__).resolve().parent
+    manifests = []
+    for manifest_path in tools_dir.glob("*/tool.toml"):
+        tool_id = manifest_path.parent.name
+        try:
+            meta = tomllib.loads(manifest_path.read_text(encoding='utf-8'))
+            info_kwargs = {
+                "name": meta["name"],
+                "description": meta.get("description", ""),
+                "icon": meta.get("icon"),
+            }
+            manifests.append((tool_id, info_kwargs, meta["entry"], int(meta.get("order", 100))))
+        except Exception as e:
+            logger.error("Invalid tool manifest %s: %s", manifest_path, str(e))
+    
+    manifests.sort(key=lambda m: (m[3], m[0]))
+    return manifests
+
+
 # 도구들을 자동으로 등록
 def _register_all_tools():
-    """모든 도구를 자동으로 등록"""
+    """모든 도구를 자동으로 등록
+
+    각 도구 폴더의 tool.toml만 읽고 도구 패키지는 import하지 않습니다.
+    """
     logger = get_tool_logger("tools")
     logger.debug("Starting tool registration")
     logger.debug("sys.frozen: %s", getattr(sys, 'frozen', False))
     
-    # renamer 도구 등록
-    try:
-        logger.debug("Attempting to import tools.renamer")
-        from tools.renamer import RenamerTool, RENAMER_INFO
-        logger.debug("Successfully imported RenamerTool and RENAMER_INFO")
-        register_tool("renamer", RENAMER_INFO, RenamerTool)
-        logger.info("Renamer tool registered successfully")
-    except ImportError as e:
-        logger.error("Failed to import renamer tool: %s", str(e), exc_info=True)
-        # 도구가 없으면 무시
-    except Exception as e:
-        logger.error("Unexpected error while registering renamer tool: %s", str(e), exc_info=True)
+    for tool_id, info_kwargs, entry, _ in _load_tool_manifests(logger):
+        register_tool(tool_id, ToolInfo(**info_kwargs), entry)
+        logger.info("Tool registered successfully: %s", tool_id)
+    
+    _register_entry_point_tools(logger)
+
+
+def _register_entry_point_tools(logger: logging.Logger) -> None:
+    """설치된 패키지가 entry point로 선언한 외부 도구 등록
+
+    entry point의 값("module:attr")을 그대로 import 문자열로 등록하므로
+    도구 모듈은 실제로 열릴 때까지 로드되지 않습니다.
+    EXE 모드에서는 패키지 메타데이터가 없으므로 건너뜁니다.
+    """
+    if getattr(sys, 'frozen', False):
+        return
+    
+    from importlib.metadata import entry_points
     
-    # folder_creator 도구 등록
     try:
-        logger.debug("Attempting to import tools.folder_creator")
-        from tools.folder_creator import FolderCreatorTool, FOLDER_CREATOR_INFO
-        logger.debug("Successfully imported FolderCreatorTool and FOLDER_CREATOR_INFO")
-        register_tool("folder_creator", FOLDER_CREATOR_INFO, FolderCreatorTool)
-        logger.info("Folder Creator tool registered successfully")
-    except ImportError as e:
-        logger.error("Failed to import folder_creator tool: %s", str(e), exc_info=True)
-        # 도구가 없으면 무시
+        try:
+            eps = entry_points(group=_ENTRY_POINT_GROUP)
+        except TypeError:
+            # Python 3.8/3.9: group 키워드 미지원
+            eps = entry_points().get(_ENTRY_POINT_GROUP, [])
     except Exception as e:
-        logger.error("Unexpected error while registering folder_creator tool: %s", str(e), exc_info=True)
+        logger.error("Failed to read tool entry points: %s", str(e), exc_info=True)
+        return
+    
+    for ep in eps:
+        if ep.name in _registered_tools:
+            logger.warning("Tool id already registered, skipping entry point: %s", ep.name)
+            continue
+        dist = getattr(ep, 'dist', None)
+        summary = dist.metadata.get("Summary") if dist is not None else None
+        register_tool(ep.name, ToolInfo(name=ep.name, description=summary or ""), ep.value)
+        logger.info("Entry point tool registered: %s (%s)", ep.name, ep.value)
 
 
 # 모듈 로드 시 자동 등록
 _register_all_tools()
-
@@ -1,13 +1,14 @@
 """공통 유틸리티 모듈"""
 
-from tools.common.path_utils import natural_sort_key
-from tools.common.file_utils import ensure_write, list_files
-from tools.common.ui_utils import load_ui_file
+from tools.common.path_utils import natural_sort_key, natural_sort_key_str
+from tools.common.file_utils import ensure_write, ensure_write_many, list_files
 from tools.common.log_utils import setup_logger, get_tool_logger, get_log_directory
 
 __all__ = [
     "natural_sort_key",
+    "natural_sort_key_str",
     "ensure_write",
+    "ensure_write_many",
     "list_files",
     "load_ui_file",
     "setup_logger",
@@ -15,3 +16,11 @@ __all__ = [
     "get_log_directory",
 ]
 
+
+def __getattr__(name: str):
+    """PySide6에 의존하는 유틸리티는 실제 사용 시점에 import (PEP 562)"""
+    if name == "load_ui_file":
+        from tools.common.ui_utils import load_ui_file
+        globals()[name] = load_ui_file
+        return load_ui_file
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
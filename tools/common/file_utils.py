@@ -1,45 +1,209 @@
 """파일 관련 범용 함수"""
 from __future__ import annotations
 
+import errno
+import fnmatch
+import itertools
+import os
+import re
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from operator import methodcaller
 from pathlib import Path
 import shutil
+from typing import Callable, Iterable, Iterator
 
+_PATTERN_SEP = re.compile(r"\s*[;|]\s*")
+_GLOB_CHARS = frozenset("*?[")
 
-def list_files(folder: Path, pattern: str, recursive: bool = True) -> list[Path]:
+
+def _iter_files(root: str, match: Callable[[str], object] | None, recursive: bool) -> Iterator[str]:
+    """os.scandir 기반 파일 탐색 (파일 경로 문자열을 yield)
+    
+    DirEntry의 파일 종류 정보는 디렉토리 읽기 시 함께 얻어지므로
+    항목마다 별도 stat 호출이 필요 없습니다.
+    심볼릭 링크 폴더는 Path.rglob과 동일하게 따라가지 않습니다.
+    match가 None이면 모든 파일을 yield합니다.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except PermissionError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.is_file() and (match is None or match(entry.name)):
+                    yield entry.path
+
+
+def list_files_fast(folder: str | Path, pattern: str, recursive: bool = True) -> list[str]:
+    """파일 경로 문자열 목록 반환 (정렬하지 않고 Path 객체도 만들지 않음)
+    
+    파일이 많은 폴더에서 목록만 빠르게 얻고, 정렬이나 Path 변환은
+    호출 측에서 필요한 시점에 하도록 할 때 사용합니다.
+    반환되는 경로는 모두 os.fspath(folder)로 시작합니다.
+    
+    Args:
+        folder: 검색할 폴더
+        pattern: 파일 패턴 (예: "*.bmp", "*.txt", 여러 개는 "*.bmp;*.png")
+        recursive: 하위 폴더까지 재귀적으로 검색할지 여부
+        
+    Returns:
+        탐색 순서대로의 파일 경로 문자열 리스트
+    """
+    root = os.fspath(folder)
+    
+    if "/" in pattern or "\\" in pattern:
+        # 경로 구분자가 포함된 패턴은 pathlib glob에 위임
+        base = Path(root)
+        found = base.rglob(pattern) if recursive else base.glob(pattern)
+        return [str(p) for p in found if p.is_file()]
+    
+    # "*.bmp;*.png" 처럼 ; 또는 | 로 여러 패턴 지정 가능 (하나의 정규식으로 합쳐서 매칭)
+    patterns = [p for p in _PATTERN_SEP.split(pattern) if p.strip()] or ["*"]
+    if "*" in patterns:
+        # 필터 없음: 파일명 매칭 생략
+        match = None
+    elif all(p.startswith("*.") and not _GLOB_CHARS.intersection(p[1:]) for p in patterns):
+        # "*.bmp" 같은 확장자 패턴만 있으면 정규식 대신 str.endswith로 비교
+        suffixes = tuple(p[1:] for p in patterns)
+        if os.name == "nt":
+            suffixes = tuple(x.lower() for x in suffixes)
+            match = lambda name: name.lower().endswith(suffixes)  # noqa: E731
+        else:
+            match = methodcaller("endswith", suffixes)
+    else:
+        # pathlib과 동일하게 Windows에서는 대소문자 구분 없이 매칭
+        flags = re.IGNORECASE if os.name == "nt" else 0
+        match = re.compile("|".join(map(fnmatch.translate, patterns)), flags).match
+    
+    return list(_iter_files(root, match, recursive))
+
+
+def list_files(folder: Path, pattern: str, recursive: bool = True, sort: bool = True) -> list[Path]:
     """파일 목록 반환 (범용 함수)
     
     Args:
         folder: 검색할 폴더
         pattern: 파일 패턴 (예: "*.bmp", "*.txt")
         recursive: 하위 폴더까지 재귀적으로 검색할지 여부
+        sort: False이면 정렬하지 않고 탐색 순서대로 반환
         
     Returns:
-        정렬된 파일 경로 리스트 (자연스러운 정렬)
+        정렬된 파일 경로 리스트 (자연스러운 정렬, sort=False이면 탐색 순서)
         
     Example:
         >>> folder = Path("/path/to/folder")
         >>> files = list_files(folder, "*.bmp")
     """
-    from tools.common.path_utils import natural_sort_key
+    from tools.common.path_utils import natural_sort_key_str
+    
+    paths_str = list_files_fast(folder, pattern, recursive)
+    if sort and len(paths_str) > 1:
+        # list.sort는 key를 원소당 한 번만 계산하므로 별도 캐시 불필요
+        paths_str.sort(key=lambda s: natural_sort_key_str(os.path.basename(s)))
+    return [Path(s) for s in paths_str]
+
+
+def _copy_file(src: str | Path, dst: str | Path, preserve_meta: bool = True, exclusive: bool = False) -> None:
+    """파일 내용을 OS의 커널 복사 경로로 복사 (preserve_meta면 메타데이터도 복사)
+    
+    - Linux: os.sendfile로 커널 내부에서 복사 (사용자 공간 버퍼 없음)
+    - Windows: kernel32.CopyFileExW 사용
+    - 그 외 또는 실패 시: shutil.copy2 (메타데이터 제외 시 shutil.copyfile)로 대체
     
-    if recursive:
-        paths = [p for p in folder.rglob(pattern) if p.is_file()]
+    exclusive가 True면 dst가 이미 있을 때 덮어쓰지 않고 FileExistsError를 발생시킵니다.
+    """
+    try:
+        if sys.platform.startswith("linux"):
+            with open(src, 'rb') as fsrc, open(dst, 'xb' if exclusive else 'wb') as fdst:
+                # 여기부터 dst는 이 함수가 만든 파일이므로 대체 경로에서 덮어써도 됨
+                exclusive = False
+                size = os.fstat(fsrc.fileno()).st_size
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            if preserve_meta:
+                shutil.copystat(src, dst)
+            return
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+            
+            copy_file_ex = ctypes.WinDLL("kernel32", use_last_error=True).CopyFileExW
+            copy_file_ex.argtypes = [
+                wintypes.LPCWSTR,
+                wintypes.LPCWSTR,
+                ctypes.c_void_p,  # LPPROGRESS_ROUTINE
+                ctypes.c_void_p,  # LPVOID
+                ctypes.POINTER(wintypes.BOOL),  # LPBOOL
+                wintypes.DWORD,
+            ]
+            copy_file_ex.restype = wintypes.BOOL
+            flags = 0x1 if exclusive else 0  # COPY_FILE_FAIL_IF_EXISTS
+            if not copy_file_ex(os.fspath(src), os.fspath(dst), None, None, None, flags):
+                # ERROR_FILE_EXISTS는 FileExistsError로 변환됨
+                raise ctypes.WinError(ctypes.get_last_error())
+            if preserve_meta:
+                shutil.copystat(src, dst)
+            return
+    except FileExistsError:
+        raise
+    except OSError:
+        pass
+    if exclusive and os.path.lexists(dst):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(dst))
+    if preserve_meta:
+        shutil.copy2(src, dst)
     else:
-        paths = [p for p in folder.glob(pattern) if p.is_file()]
-    return sorted(paths, key=natural_sort_key)
+        shutil.copyfile(src, dst)
+
+
+def _move_file(src: str | Path, dst: str | Path, overwrite: bool) -> None:
+    """파일 이동 (같은 장치면 rename 시스템 콜 한 번, 아니면 shutil.move)
+    
+    overwrite가 False이고 dst가 이미 있으면 FileExistsError를 발생시킵니다.
+    """
+    if not overwrite and os.name != "nt" and os.path.lexists(dst):
+        # POSIX rename은 기존 파일을 조용히 덮어쓰므로 이 경우만 미리 확인
+        # (Windows의 os.rename은 스스로 FileExistsError를 발생시킴)
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(dst))
+    try:
+        (os.replace if overwrite else os.rename)(src, dst)
+        return
+    except OSError as e:
+        if e.errno not in (errno.EXDEV, errno.ENOTSUP):
+            raise
+    # cross-device 이동 지원 (shutil.move는 기존 파일을 덮어쓰므로 다시 확인)
+    if not overwrite and os.path.lexists(dst):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), str(dst))
+    shutil.move(os.fspath(src), os.fspath(dst))
 
 
 def ensure_write(
-    src: Path,
-    dst: Path,
+    src: str | Path,
+    dst: str | Path,
     *,
     move: bool = False,
     overwrite: bool = False,
     dry_run: bool = False,
     verbose: bool = False,
+    make_parents: bool = True,
+    preserve_meta: bool = True,
 ) -> None:
     """파일 쓰기 처리 (복사/이동) - 범용 함수
     
+    대상 파일 존재 여부를 미리 stat으로 확인하지 않고 쓰기를 먼저 시도한 뒤
+    FileExistsError가 나면 overwrite에 따라 덮어쓰거나 건너뜁니다.
+    경로는 문자열 그대로 os 함수에 전달하므로 Path 객체를 만들지 않아도 됩니다.
+    
     Args:
         src: 원본 파일 경로
         dst: 대상 파일 경로
@@ -47,34 +211,132 @@ def ensure_write(
         overwrite: True면 기존 파일 덮어쓰기
         dry_run: True면 실제 작업 없이 로그만 출력
         verbose: True면 상세한 로그 출력
+        make_parents: True면 dst의 부모 폴더를 생성 (호출자가 이미 생성했다면 False)
+        preserve_meta: 복사 시 수정 시간/권한 등 메타데이터도 복사할지 여부
+            (False면 내용만 복사하여 파일당 stat/chmod/utime 호출을 줄임)
         
     Example:
         >>> src = Path("source.txt")
         >>> dst = Path("destination.txt")
         >>> ensure_write(src, dst, move=True, overwrite=True)
     """
-    if dst.exists():
-        if overwrite:
-            if verbose:
+    action = "move" if move else "copy"
+    
+    if dry_run:
+        if verbose:
+            if os.path.exists(dst):
+                if not overwrite:
+                    print(f"[skip] 대상 파일 이미 존재: {dst}")
+                    return
                 print(f"[overwrite] {dst}")
-            if not dry_run and dst.is_file():
-                dst.unlink()
+            print(f"[{action}] {os.path.basename(src)} -> {os.path.basename(dst)}")
+        return
+    
+    if make_parents:
+        parent = os.path.dirname(dst)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+    try:
+        if move:
+            _move_file(src, dst, overwrite)
         else:
+            _copy_file(src, dst, preserve_meta, exclusive=True)
+    except FileExistsError:
+        if not overwrite:
             if verbose:
                 print(f"[skip] 대상 파일 이미 존재: {dst}")
             return
+        # overwrite 복사에서만 도달 (이동은 os.replace로 바로 덮어씀)
+        if verbose:
+            print(f"[overwrite] {dst}")
+        if os.path.isfile(dst):
+            os.unlink(dst)
+        _copy_file(src, dst, preserve_meta)
     
     if verbose:
-        action = "move" if move else "copy"
-        print(f"[{action}] {src.name} -> {dst.name}")
+        print(f"[{action}] {os.path.basename(src)} -> {os.path.basename(dst)}")
+
+
+def ensure_write_many(
+    pairs: Iterable[tuple[str | Path, str | Path]],
+    *,
+    move: bool = False,
+    overwrite: bool = False,
+    dry_run: bool = False,
+    verbose: bool = False,
+    max_workers: int | None = None,
+    on_done: Callable[[str | Path, str | Path], None] | None = None,
+    preserve_meta: bool = True,
+    make_parents: bool = True,
+) -> int:
+    """여러 파일을 스레드 풀로 병렬 쓰기 처리 (복사/이동) - 범용 함수
     
-    if dry_run:
-        return
+    shutil의 복사/이동은 I/O 동안 GIL을 해제하므로 스레드로 병렬화하면
+    디스크/네트워크 대기 시간을 겹칠 수 있습니다.
+    대상 부모 폴더는 작업 시작 전에 폴더별로 한 번만 생성합니다.
+    dry_run이거나 max_workers가 1 이하이면 스레드 없이 순서대로 처리합니다.
     
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    if move:
-        # cross-device 이동 지원
-        shutil.move(str(src), str(dst))
-    else:
-        shutil.copy2(src, dst)
-
+    Args:
+        pairs: (원본 경로, 대상 경로) 목록
+        move, overwrite, dry_run, verbose, preserve_meta: ensure_write와 동일
+        max_workers: 스레드 수 (None이면 min(32, CPU 수 * 4))
+        on_done: 파일 하나가 끝날 때마다 (src, dst)로 호출되는 콜백 (완료 순서)
+        make_parents: True면 대상 부모 폴더를 생성 (호출자가 이미 생성했거나 원본 폴더 안에 쓴다면 False)
+        
+    Returns:
+        처리된 파일 개수
+        
+    Example:
+        >>> pairs = [(Path("a.bmp"), Path("out/a.bmp")), (Path("b.bmp"), Path("out/b.bmp"))]
+        >>> ensure_write_many(pairs, overwrite=True)
+        2
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return 0
+    
+    if make_parents and not dry_run:
+        for parent in {os.path.dirname(dst) for _, dst in pairs}:
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+    
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+    
+    kwargs = dict(
+        move=move,
+        overwrite=overwrite,
+        dry_run=dry_run,
+        verbose=verbose,
+        make_parents=False,
+        preserve_meta=preserve_meta,
+    )
+    
+    done = 0
+    if dry_run or max_workers <= 1:
+        # 숨길 I/O가 없거나 순차 실행이면 스레드 풀 없이 바로 처리
+        for src, dst in pairs:
+            ensure_write(src, dst, **kwargs)
+            done += 1
+            if on_done is not None:
+                on_done(src, dst)
+        return done
+    
+    # 동시에 제출하는 작업 수를 제한 (파일이 많아도 Future 객체가 한꺼번에 쌓이지 않도록)
+    max_pending = max_workers * 8
+    pending = {}
+    it = iter(pairs)
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        while True:
+            for src, dst in itertools.islice(it, max_pending - len(pending)):
+                pending[ex.submit(ensure_write, src, dst, **kwargs)] = (src, dst)
+            if not pending:
+                break
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                src, dst = pending.pop(fut)
+                fut.result()
+                done += 1
+                if on_done is not None:
+                    on_done(src, dst)
+    return done
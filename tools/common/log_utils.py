@@ -7,6 +7,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+# 로그 파일별 공유 FileHandler (로거마다 파일을 따로 열지 않도록 재사용)
+# key: (로그 파일 절대 경로, 포맷 문자열)
+_FILE_HANDLERS: dict[tuple[str, str], logging.FileHandler] = {}
+
 
 def get_log_directory() -> Path:
     """로그 파일 저장 디렉토리 반환
@@ -34,7 +38,7 @@ def get_log_directory() -> Path:
 def setup_logger(
     name: str,
     log_file: Optional[str | Path] = None,
-    level: int = logging.DEBUG,
+    level: int = logging.INFO,
     format_string: Optional[str] = None,
 ) -> logging.Logger:
     """로거 설정 및 반환
@@ -86,15 +90,21 @@ def setup_logger(
             log_file = log_dir / log_file
         log_file.parent.mkdir(parents=True, exist_ok=True)
     
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
-    file_handler.setLevel(level)
-    file_handler.setFormatter(formatter)
+    # 같은 파일을 쓰는 로거끼리 하나의 핸들러(파일 디스크립터, 락)를 공유
+    # 레벨 필터링은 각 로거의 레벨로 처리하므로 핸들러 레벨은 지정하지 않음
+    # delay=True: 실제로 로그가 기록될 때 파일을 염
+    key = (str(Path(log_file).resolve()), format_string)
+    file_handler = _FILE_HANDLERS.get(key)
+    if file_handler is None:
+        file_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
+        file_handler.setFormatter(formatter)
+        _FILE_HANDLERS[key] = file_handler
     logger.addHandler(file_handler)
     
     return logger
 
 
-def get_tool_logger(tool_name: str, level: int = logging.DEBUG) -> logging.Logger:
+def get_tool_logger(tool_name: str, level: int = logging.INFO) -> logging.Logger:
     """도구별 로거 생성 (간편 함수)
     
     Args:
@@ -1,28 +1,43 @@
 """경로 관련 범용 함수"""
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 import re
 
+_SPLIT_DIGITS = re.compile(r"(\d+)")
 
-def natural_sort_key(path: Path) -> list:
+
+def natural_sort_key(path: Path) -> tuple:
     """자연스러운 정렬을 위한 키 생성 (범용 함수)
     
     Args:
         path: 정렬할 경로
         
     Returns:
-        정렬 키 리스트
+        정렬 키 튜플
         
     Example:
         >>> paths = [Path("file10.txt"), Path("file2.txt"), Path("file1.txt")]
         >>> sorted(paths, key=natural_sort_key)
         [Path("file1.txt"), Path("file2.txt"), Path("file10.txt")]
     """
-    name = path.name
-    tok = re.split(r"(\d+)", name)
-    key = []
-    for t in tok:
-        key.append(int(t) if t.isdigit() else t.lower())
-    return key
+    return natural_sort_key_str(path.name)
+
+
+@lru_cache(maxsize=100_000)
+def natural_sort_key_str(name: str) -> tuple:
+    """파일명 문자열용 자연 정렬 키 (Path 객체 생성 없이 정렬할 때 사용)
+    
+    스캔 -> 미리보기 -> 실행에서 같은 파일명을 반복해서 정렬하므로 결과를 캐시합니다.
+    
+    Example:
+        >>> sorted(["file10.txt", "file2.txt"], key=natural_sort_key_str)
+        ["file2.txt", "file10.txt"]
+    """
+    # 캡처 그룹으로 split하면 [텍스트, 숫자, 텍스트, ...] 순서이므로 홀수 위치가 숫자 토큰
+    # (토큰마다 문자 종류를 검사하지 않고, 소문자 변환도 이름 전체에 한 번만 수행)
+    tokens = _SPLIT_DIGITS.split(name.lower())
+    tokens[1::2] = map(int, tokens[1::2])
+    return tuple(tokens)
 
@@ -1,12 +1,52 @@
 """UI 관련 범용 함수"""
 from __future__ import annotations
 
+import functools
+import importlib.util
+import sys
 from pathlib import Path
-from PySide6.QtCore import QFile, QIODevice, QByteArray, QBuffer
-from PySide6.QtWidgets import QMainWindow, QWidget, QHeaderView, QTreeWidgetItem
+from PySide6.QtCore import QFile, QIODevice, QByteArray, QBuffer, QObject
+from PySide6.QtWidgets import QMainWindow
 from PySide6.QtUiTools import QUiLoader
 
 
+@functools.lru_cache(maxsize=32)
+def _read_ui_bytes(abs_path_str: str) -> bytes:
+    """.ui 파일 내용을 읽어 캐시 (같은 도구를 다시 열 때 디스크 읽기 생략)"""
+    return Path(abs_path_str).read_bytes()
+
+
+@functools.lru_cache(maxsize=32)
+def _load_generated_ui_class(py_path_str: str) -> type:
+    """pyside6-uic로 생성된 모듈에서 Ui_* 클래스를 로드하여 캐시"""
+    py_path = Path(py_path_str)
+    module_name = f"_generated_ui_{py_path.parent.parent.name}_{py_path.stem}"
+    spec = importlib.util.spec_from_file_location(module_name, py_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Unable to load generated UI module: {py_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    for name, value in vars(module).items():
+        if name.startswith("Ui_") and isinstance(value, type):
+            return value
+    raise ImportError(f"No Ui_* class in generated UI module: {py_path}")
+
+
+def _find_generated_ui(ui_path: Path) -> Path | None:
+    """.ui 옆의 생성된 *_ui.py 경로 반환 (없거나 .ui보다 오래되었으면 None)
+    
+    EXE 모드에서는 빌드 시 생성된 파일을 그대로 사용합니다.
+    """
+    py_path = ui_path.with_name(f"{ui_path.stem}_ui.py")
+    if not py_path.exists():
+        return None
+    if getattr(sys, 'frozen', False) or not ui_path.exists():
+        return py_path
+    if py_path.stat().st_mtime < ui_path.stat().st_mtime:
+        return None
+    return py_path
+
+
 def load_ui_file(ui_path: Path | str, target_window: QMainWindow) -> None:
     """Designer .ui 파일을 로드하여 QMainWindow에 적용
     
@@ -14,6 +54,9 @@ def load_ui_file(ui_path: Path | str, target_window: QMainWindow) -> None:
     Designer에서 설정한 objectName으로 정의된 모든 위젯을
     target_window 인스턴스에 자동으로 연결합니다.
     
+    scripts/build_uis.py로 생성한 최신 *_ui.py가 있으면 XML 파싱 없이
+    생성된 setupUi()를 사용하고, 없으면 QUiLoader로 .ui를 직접 로드합니다.
+    
     Args:
         ui_path: .ui 파일 경로
         target_window: UI를 적용할 QMainWindow 인스턴스
@@ -27,6 +70,17 @@ def load_ui_file(ui_path: Path | str, target_window: QMainWindow) -> None:
         ...         # 예: self.btn_run.clicked.connect(...)
     """
     ui_path = Path(ui_path)
+    
+    generated = _find_generated_ui(ui_path)
+    if generated is not None:
+        ui = _load_generated_ui_class(str(generated.resolve()))()
+        ui.setupUi(target_window)
+        # setupUi가 ui 객체에 저장한 위젯을 objectName으로 현재 윈도우에 연결
+        for name, child in vars(ui).items():
+            if not name.startswith("_") and not hasattr(target_window, name):
+                setattr(target_window, name, child)
+        return
+    
     if not ui_path.exists():
         raise FileNotFoundError(f"UI file not found: {ui_path}")
     
@@ -38,9 +92,8 @@ def load_ui_file(ui_path: Path | str, target_window: QMainWindow) -> None:
     # Windows에서 경로에 공백이 있을 때 QFile이 제대로 작동하지 않을 수 있으므로
     # 파일을 직접 읽어서 QBuffer를 통해 로드하는 방식 사용
     try:
-        # 파일을 바이너리 모드로 읽기
-        with open(abs_path, 'rb') as f:
-            file_data = f.read()
+        # 파일을 바이너리 모드로 읽기 (캐시됨)
+        file_data = _read_ui_bytes(abs_path_str)
     except IOError as e:
         raise RuntimeError(f"Unable to read UI file: {abs_path_str} (error: {e})")
     
@@ -59,6 +112,12 @@ def load_ui_file(ui_path: Path | str, target_window: QMainWindow) -> None:
     if widget is None:
         raise RuntimeError(f"Failed to load UI file: {abs_path_str}. Check if the UI file is valid XML.")
     
+    # Designer에서 objectName을 지정한 모든 하위 객체 수집 (Qt 객체 트리를 한 번만 순회)
+    # centralWidget을 옮기면 widget의 자식이 아니게 되므로 옮기기 전에 수집
+    named_children = [
+        (child.objectName(), child) for child in widget.findChildren(QObject)
+    ]
+    
     # QUiLoader는 새 위젯을 반환하므로, 위젯의 속성들을 현재 윈도우에 복사
     # .ui 파일의 최상위가 QMainWindow인 경우, centralWidget을 가져옴
     if hasattr(widget, 'centralWidget'):
@@ -71,15 +130,8 @@ def load_ui_file(ui_path: Path | str, target_window: QMainWindow) -> None:
             target_window.setCentralWidget(central)
             central.setParent(target_window)
     
-    # 위젯의 모든 속성을 현재 윈도우에 복사 (objectName으로 접근 가능하도록)
+    # 수집한 객체를 objectName으로 현재 윈도우에 연결 (pyuic 생성 코드와 동일한 방식)
     # 이렇게 하면 Designer에서 설정한 objectName으로 직접 접근 가능
-    for attr_name in dir(widget):
-        if not attr_name.startswith('_') and hasattr(widget, attr_name):
-            try:
-                attr_value = getattr(widget, attr_name)
-                # 위젯인 경우에만 복사 (메서드나 시그널은 제외)
-                if isinstance(attr_value, (QWidget, QHeaderView, QTreeWidgetItem)):
-                    setattr(target_window, attr_name, attr_value)
-            except Exception:
-                pass
-
+    for name, child in named_children:
+        if name and not name.startswith("qt_") and not hasattr(target_window, name):
+            setattr(target_window, name, child)
@@ -1,20 +1,17 @@
 """폴더 생성 도구"""
 from __future__ import annotations
 
-from tools import ToolInfo
+from tools import get_tool_info
 from tools.common.log_utils import get_tool_logger
 
 __all__ = ["FolderCreatorTool", "FOLDER_CREATOR_INFO"]
 
 logger = get_tool_logger("folder_creator")
 
-FOLDER_CREATOR_INFO = ToolInfo(
-    name="폴더 생성 도구",
-    description="특정 규칙을 가진 폴더들을 일괄 생성하는 도구",
-    icon=None,
-)
+# 이름/설명은 tool.toml에서 읽어 등록된 값을 그대로 사용
+FOLDER_CREATOR_INFO = get_tool_info("folder_creator")
 
-logger.debug("FOLDER_CREATOR_INFO created for tool_id=%s", "folder_creator")
+logger.debug("FOLDER_CREATOR_INFO loaded for tool_id=%s", "folder_creator")
 
 
 class FolderCreatorTool:
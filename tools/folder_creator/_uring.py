@@ -0,0 +1,76 @@
+"""io_uring 기반 일괄 mkdir (Linux 전용, 선택 기능)
+
+python-liburing 패키지(`pip install liburing`)가 설치된 Linux에서만 사용 가능합니다.
+mkdirat 요청을 한 번에 제출하고 완료를 모아서 받으므로
+폴더마다 시스템 콜을 따로 호출하지 않습니다.
+
+환경 변수 FOLDER_CREATOR_URING=1 로 켰을 때만 create_folders에서 사용됩니다.
+"""
+from __future__ import annotations
+
+import errno
+import os
+import sys
+
+if not sys.platform.startswith("linux"):
+    raise ImportError("io_uring is only available on Linux")
+
+from liburing import (  # noqa: E402  (플랫폼 확인 후 import)
+    AT_FDCWD,
+    io_uring,
+    io_uring_cqe,
+    io_uring_cqe_seen,
+    io_uring_get_sqe,
+    io_uring_prep_mkdirat,
+    io_uring_queue_exit,
+    io_uring_queue_init,
+    io_uring_submit,
+    io_uring_wait_cqe,
+)
+
+BATCH_SIZE = 1024
+
+
+def batch_mkdir(paths: list[str], mode: int = 0o777) -> list[bool]:
+    """paths의 폴더들을 io_uring으로 생성
+
+    Args:
+        paths: 생성할 폴더 경로 (BATCH_SIZE 이하 권장, 초과 시 나눠서 제출)
+        mode: 폴더 권한 (umask 적용)
+
+    Returns:
+        paths와 같은 순서로 각 폴더가 이미 존재했는지 여부
+
+    Raises:
+        OSError: 이미 존재하는 경우 외의 생성 실패
+    """
+    existed = [False] * len(paths)
+    ring = io_uring()
+    cqe = io_uring_cqe()
+    io_uring_queue_init(min(BATCH_SIZE, max(1, len(paths))), ring, 0)
+    try:
+        for start in range(0, len(paths), BATCH_SIZE):
+            chunk = paths[start:start + BATCH_SIZE]
+            # 제출한 요청이 완료될 때까지 경로 bytes가 살아 있어야 함
+            encoded = [os.fsencode(p) for p in chunk]
+            for i, path in enumerate(encoded):
+                sqe = io_uring_get_sqe(ring)
+                io_uring_prep_mkdirat(sqe, AT_FDCWD, path, mode)
+                sqe.user_data = i
+            io_uring_submit(ring)
+
+            error: OSError | None = None
+            for _ in range(len(encoded)):
+                io_uring_wait_cqe(ring, cqe)
+                res, idx = cqe.res, cqe.user_data
+                io_uring_cqe_seen(ring, cqe)
+                if res == -errno.EEXIST:
+                    existed[start + idx] = True
+                elif res < 0 and error is None:
+                    # 나머지 완료를 모두 받은 뒤 첫 번째 오류를 발생시킴
+                    error = OSError(-res, os.strerror(-res), chunk[idx])
+            if error is not None:
+                raise error
+    finally:
+        io_uring_queue_exit(ring)
+    return existed
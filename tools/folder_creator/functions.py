@@ -1,9 +1,12 @@
 """Folder Creator 도구 전용 함수들"""
 from __future__ import annotations
 
+import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Iterator
 
 # 직접 실행 시 프로젝트 루트를 sys.path에 추가
 if __name__ == "__main__" or (len(sys.argv) > 0 and Path(sys.argv[0]).name == Path(__file__).name):
@@ -22,6 +25,160 @@ except ImportError:
 
 logger = get_tool_logger("folder_creator")
 
+# io_uring 일괄 mkdir 사용 조건 (Linux + liburing 설치 + 환경 변수로 명시적으로 켠 경우)
+_URING_ENV = "FOLDER_CREATOR_URING"
+_URING_MIN_COUNT = 256
+
+
+# 여러 스레드로 mkdir 병렬 실행 (FOLDER_CREATOR_THREADS=0 으로 끌 수 있음:
+# 한 폴더에 동시 mkdir을 싫어하는 네트워크 파일 시스템 등)
+_THREADS_ENV = "FOLDER_CREATOR_THREADS"
+_THREADS_MIN_COUNT = 64
+
+
+def _mkdir_workers() -> int:
+    """병렬 mkdir 스레드 수 (0 이하면 순차 실행)"""
+    value = os.environ.get(_THREADS_ENV)
+    if value is not None:
+        try:
+            return int(value)
+        except ValueError:
+            logger.warning("Invalid %s=%r, using default", _THREADS_ENV, value)
+    return min(8, os.cpu_count() or 4)
+
+
+def _try_mkdir(path: str) -> bool:
+    """폴더 생성, 이미 있으면 True 반환"""
+    try:
+        os.mkdir(path)
+        return False
+    except FileExistsError:
+        return True
+
+
+def _get_uring_batch_mkdir():
+    """io_uring 일괄 mkdir 함수 반환 (사용할 수 없으면 None)"""
+    if os.environ.get(_URING_ENV) != "1":
+        return None
+    try:
+        from tools.folder_creator._uring import batch_mkdir
+    except ImportError as e:
+        logger.debug("io_uring mkdir not available, using os.mkdir: %s", str(e))
+        return None
+    return batch_mkdir
+
+
+def _build_names(prefix: str, suffix: str, padding: int, start_index: int, count: int) -> list[str]:
+    """생성할 폴더명 목록 (prefix_num_suffix)"""
+    # 폴더명 형식을 한 번만 구성하고 이름 생성만 한 번에 수행
+    make_name = f"{prefix}_{{:0{padding}d}}_{suffix}".format
+    return [make_name(i) for i in range(start_index, start_index + count)]
+
+
+def _create_all(base: str, names: list[str], present: set[str]) -> Iterator[bool]:
+    """names 순서대로 base 아래에 폴더를 만들고, 각 폴더가 이미 있었는지 yield
+    
+    present에 있는 이름은 mkdir 없이 건너뜁니다.
+    폴더 수와 설정에 따라 io_uring / 스레드 풀 / 순차 mkdir 중 하나를 사용합니다.
+    """
+    count = len(names)
+    batch_mkdir = _get_uring_batch_mkdir() if count >= _URING_MIN_COUNT else None
+    workers = _mkdir_workers() if count >= _THREADS_MIN_COUNT else 0
+    
+    if batch_mkdir is not None:
+        # io_uring: 1024개씩 mkdir 요청을 한 번에 제출하고 완료 후 yield
+        from tools.folder_creator._uring import BATCH_SIZE
+        logger.debug("Creating folders with io_uring (batch=%d)", BATCH_SIZE)
+        for chunk_start in range(0, count, BATCH_SIZE):
+            chunk = names[chunk_start:chunk_start + BATCH_SIZE]
+            missing = [base + name for name in chunk if name not in present]
+            results = iter(batch_mkdir(missing) if missing else ())
+            for name in chunk:
+                yield name in present or next(results)
+    elif workers > 1:
+        # mkdir은 시스템 콜 동안 GIL을 놓으므로 스레드로 겹쳐 실행
+        # map 결과는 순서대로 나오므로 완료되는 대로 yield
+        logger.debug("Creating folders with %d threads", workers)
+        missing = [base + name for name in names if name not in present]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_try_mkdir, missing)
+            for name in names:
+                yield name in present or next(results)
+    else:
+        debug = logger.isEnabledFor(logging.DEBUG)  # 항목별 로그는 DEBUG일 때만
+        for name in names:
+            folder_str = base + name
+            if name in present:
+                if debug:
+                    logger.debug("Folder already exists: %s", folder_str)
+                yield True
+                continue
+            # 목록 확인 이후 다른 곳에서 생성된 경우도 FileExistsError로 처리
+            try:
+                os.mkdir(folder_str)
+            except FileExistsError:
+                if debug:
+                    logger.debug("Folder already exists: %s", folder_str)
+                yield True
+                continue
+            if debug:
+                logger.debug("Created folder: %s", folder_str)
+            yield False
+
+
+def _prepare_parent(parent_path: str | Path) -> tuple[str, set[str]]:
+    """부모 폴더를 준비하고 (경로 문자열, 이미 있는 항목 이름 집합) 반환"""
+    # 경로는 문자열로만 다루고 Path는 필요할 때만 생성
+    parent = os.fspath(parent_path)
+    
+    # 부모 폴더가 없으면 생성 (이미 있으면 아무것도 하지 않음)
+    os.makedirs(parent, exist_ok=True)
+    
+    # 이미 있는 항목은 scandir 한 번으로 확인하고 mkdir을 건너뜀
+    # (재실행 시 폴더마다 mkdir 시스템 콜과 FileExistsError 예외가 발생하지 않도록)
+    with os.scandir(parent) as it:
+        present = {entry.name for entry in it}
+    return parent, present
+
+
+def _log_summary(parent: str, count: int, existing: int) -> None:
+    """생성 결과 요약 로그"""
+    if existing:
+        logger.warning("%d of %d folders already existed in %s", existing, count, parent)
+    logger.info("Created %d folders in %s", count - existing, parent)
+
+
+def iter_create_folders(
+    parent_path: str | Path,
+    count: int,
+    prefix: str,
+    suffix: str,
+    padding: int = 4,
+    start_index: int = 1,
+) -> Iterator[Path]:
+    """특정 규칙을 가진 폴더들을 생성하면서 하나씩 반환 (generator)
+    
+    폴더를 하나 만들 때마다 경로를 yield하므로 호출 측에서
+    생성과 진행률 보고를 한 번의 순회로 처리할 수 있습니다.
+    인자는 create_folders와 동일합니다.
+    
+    Yields:
+        생성된 (또는 이미 존재하던) 폴더 경로
+    """
+    parent, present = _prepare_parent(parent_path)
+    
+    # 이름 생성과 mkdir을 단계별로 분리
+    names = _build_names(prefix, suffix, padding, start_index, count)
+    base = parent + os.sep
+    
+    existing = 0
+    for name, already in zip(names, _create_all(base, names, present)):
+        if already:
+            existing += 1
+        yield Path(base + name)
+    
+    _log_summary(parent, count, existing)
+
 
 def create_folders(
     parent_path: str | Path,
@@ -30,9 +187,11 @@ def create_folders(
     suffix: str,
     padding: int = 4,
     start_index: int = 1,
-) -> List[Path]:
+) -> int:
     """특정 규칙을 가진 폴더들을 생성
     
+    폴더 경로가 필요하면 iter_create_folders를 사용하세요.
+    
     Args:
         parent_path: 부모 폴더 경로
         count: 생성할 폴더 개수
@@ -42,40 +201,17 @@ def create_folders(
         start_index: 시작 인덱스 (기본값: 1)
         
     Returns:
-        생성된 폴더 경로 리스트
+        새로 생성된 폴더 개수 (이미 있던 폴더 제외)
         
     Example:
         >>> create_folders("/path/to/parent", 20, "test", "bseong", 4, 1)
-        [Path("/path/to/parent/test_0001_bseong"), ...]
+        20
     """
-    parent = Path(parent_path)
-    
-    # 부모 폴더가 없으면 생성
-    if not parent.exists():
-        logger.debug("Creating parent directory: %s", parent)
-        parent.mkdir(parents=True, exist_ok=True)
-    
-    created_folders = []
-    
-    for i in range(count):
-        index = start_index + i
-        num_str = f"{index:0{padding}d}"
-        
-        # 폴더명 생성: prefix_num_suffix
-        folder_name = f"{prefix}_{num_str}_{suffix}"
-        folder_path = parent / folder_name
-        
-        # 폴더 생성
-        if not folder_path.exists():
-            folder_path.mkdir(parents=True, exist_ok=True)
-            logger.debug("Created folder: %s", folder_path)
-        else:
-            logger.warning("Folder already exists: %s", folder_path)
-        
-        created_folders.append(folder_path)
-    
-    logger.info("Created %d folders in %s", len(created_folders), parent)
-    return created_folders
+    parent, present = _prepare_parent(parent_path)
+    names = _build_names(prefix, suffix, padding, start_index, count)
+    existing = sum(_create_all(parent + os.sep, names, present))
+    _log_summary(parent, count, existing)
+    return count - existing
 
 
 # CLI 테스트 지원
@@ -101,7 +237,5 @@ if __name__ == "__main__":
         args.start_index,
     )
     
-    print(f"Created {len(result)} folders:")
-    for folder in result:
-        print(f"  {folder}")
+    print(f"Created {result} folders in {args.parent_path}")
 
@@ -2,11 +2,14 @@
 """Folder Creator 도구의 GUI"""
 from __future__ import annotations
 
+import functools
 import json
 import sys
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
 
-from PySide6.QtCore import QThread, Slot
+from PySide6.QtCore import QThreadPool, QTimer, Slot
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -25,7 +28,24 @@ from PySide6.QtWidgets import (
 )
 
 from tools.common.log_utils import get_tool_logger
-from tools.folder_creator.pipeline import FolderCreatorWorker
+from tools.folder_creator.pipeline import FolderCreatorRunnable, FolderCreatorWorker
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    def _json_loads(data: bytes):
+        return json.loads(data.decode('utf-8'))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_constants_cached() -> Mapping:
+    """constants.json 로드 (최초 1회만 읽고 이후 윈도우에서는 재사용)
+
+    캐시된 값이 변경되지 않도록 읽기 전용 Mapping으로 반환합니다.
+    """
+    config_path = Path(__file__).parent / 'constants.json'
+    return MappingProxyType(_json_loads(config_path.read_bytes()))
 
 
 class FolderCreatorWindow(QMainWindow):
@@ -34,20 +54,26 @@ class FolderCreatorWindow(QMainWindow):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.logger = get_tool_logger("folder_creator")
-        self.constants = self._load_constants()
+        self.constants = _load_constants_cached()
         self._load_ui()
         self._connect()
 
-        self.thread: QThread | None = None
-        self.worker: FolderCreatorWorker | None = None
+        # 작업 전용 스레드 1개를 윈도우가 소유하고 실행마다 재사용 (만료 없음)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._pool.setExpiryTimeout(-1)
+        self.worker: FolderCreatorWorker | None = None  # 첫 실행 시 생성 후 재사용
+        self._running = False
+        
+        # 진행률/로그 표시는 모아서 약 30Hz로 갱신 (진행률은 최신 값만 사용)
+        self._pending_progress: tuple[int, int] | None = None
+        self._pending_log: list[str] = []
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
         self.logger.info("FolderCreatorWindow initialized")
 
-    def _load_constants(self) -> dict:
-        """constants.json 로드"""
-        config_path = Path(__file__).parent / 'constants.json'
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-
     def _load_ui(self) -> None:
         """UI 위젯 직접 생성"""
         self.setWindowTitle("폴더 생성 도구")
@@ -131,6 +157,7 @@ class FolderCreatorWindow(QMainWindow):
         # 로그 텍스트 영역
         self.log = QPlainTextEdit()
         self.log.setReadOnly(True)
+        self.log.setMaximumBlockCount(2000)  # 오래된 줄부터 삭제 (대량 생성 시 메모리/갱신 비용 제한)
         main_layout.addWidget(self.log)
 
     def _connect(self) -> None:
@@ -185,22 +212,25 @@ class FolderCreatorWindow(QMainWindow):
         self.log.appendPlainText("작업 시작...")
         self.logger.info("User started folder creation task: parent=%s, count=%d", parent_path, count)
 
-        self.thread = QThread(self)
-        self.worker = FolderCreatorWorker(
-            parent_path=parent_path,
-            count=count,
-            prefix=prefix,
-            suffix=suffix,
-            padding=padding,
-            start_index=start_index,
-        )
-        self.worker.moveToThread(self.thread)
-        self.thread.started.connect(self.worker.run)
-        self.worker.progressed.connect(self._on_progress)
-        self.worker.progress.connect(self._on_progress_update)
-        self.worker.finished.connect(self._on_finished)
-        self.worker.failed.connect(self._on_failed)
-        self.thread.start()
+        if self.worker is None:
+            self.worker = FolderCreatorWorker(
+                parent_path=parent_path,
+                count=count,
+                prefix=prefix,
+                suffix=suffix,
+                padding=padding,
+                start_index=start_index,
+            )
+            self.worker.progressed.connect(self._on_progress)
+            self.worker.progress.connect(self._on_progress_update)
+            self.worker.finished.connect(self._on_finished)
+            self.worker.failed.connect(self._on_failed)
+        else:
+            self.worker.configure(parent_path, count, prefix, suffix, padding, start_index)
+        
+        # 윈도우 전용 스레드에서 실행 (스레드 생성/종료 비용 없이 재사용)
+        self._running = True
+        self._pool.start(FolderCreatorRunnable(self.worker))
 
     @Slot()
     def _on_run(self) -> None:
@@ -209,13 +239,34 @@ class FolderCreatorWindow(QMainWindow):
 
     @Slot(str)
     def _on_progress(self, text: str) -> None:
-        """진행 로그 업데이트"""
+        """진행 로그 업데이트 (타이머로 모아서 반영)"""
         if text:
-            self.log.appendPlainText(text.rstrip("\n"))
+            self._pending_log.append(text.rstrip("\n"))
+            if not self._progress_timer.isActive():
+                self._progress_timer.start()
 
     @Slot(int, int)
     def _on_progress_update(self, current: int, total: int) -> None:
-        """진행률 업데이트"""
+        """진행률 업데이트 (타이머로 모아서 반영)"""
+        self._pending_progress = (current, total)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    @Slot()
+    def _flush_progress(self) -> None:
+        """대기 중인 로그와 최신 진행률을 위젯에 반영"""
+        if self._pending_log:
+            # 추가하는 동안 화면 갱신을 멈추고 끝난 뒤 한 번만 다시 그림
+            self.log.setUpdatesEnabled(False)
+            try:
+                self.log.appendPlainText("\n".join(self._pending_log))
+            finally:
+                self.log.setUpdatesEnabled(True)
+            self._pending_log.clear()
+        if self._pending_progress is None:
+            return
+        current, total = self._pending_progress
+        self._pending_progress = None
         if total <= 0:
             self.progress.setRange(0, 0)
             return
@@ -225,12 +276,15 @@ class FolderCreatorWindow(QMainWindow):
     @Slot()
     def _on_clear_log(self) -> None:
         """로그 삭제"""
+        self._pending_log.clear()
         self.log.clear()
 
     @Slot(int)
     def _on_finished(self, count: int) -> None:
         """작업 완료"""
         msg = f"완료: {count}개 폴더 생성됨"
+        self._progress_timer.stop()
+        self._flush_progress()
         self.log.appendPlainText(msg)
         self.logger.info("Task completed: %d folders created", count)
         self._cleanup_worker()
@@ -241,6 +295,8 @@ class FolderCreatorWindow(QMainWindow):
     def _on_failed(self, msg: str) -> None:
         """작업 실패"""
         error_msg = f"오류: {msg}"
+        self._progress_timer.stop()
+        self._flush_progress()
         self.log.appendPlainText(error_msg)
         self.logger.error("Task failed: %s", msg)
         self._cleanup_worker()
@@ -248,12 +304,18 @@ class FolderCreatorWindow(QMainWindow):
         QMessageBox.critical(self, "오류", error_msg)
 
     def _cleanup_worker(self) -> None:
-        """Worker 정리"""
-        if self.thread and self.worker:
-            self.thread.quit()
-            self.thread.wait()
-        self.thread = None
-        self.worker = None
+        """Worker 정리 (Worker와 스레드는 다음 실행에 재사용)"""
+        self._running = False
+
+    def closeEvent(self, event) -> None:
+        """작업 중에는 닫지 않음 (닫으면 결과를 받을 윈도우가 삭제됨)"""
+        if self._running:
+            QMessageBox.warning(self, "경고", "작업이 진행 중입니다. 완료 후 닫아 주세요.")
+            event.ignore()
+            return
+        # 작업 스레드는 윈도우가 닫힐 때만 종료
+        self._pool.waitForDone()
+        super().closeEvent(event)
 
     def _set_running(self, running: bool) -> None:
         """실행 중 상태 설정"""
@@ -1,12 +1,13 @@
 """Folder Creator 도구의 연산 Pipeline"""
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
 
 from tools.common.log_utils import get_tool_logger
-from tools.folder_creator.functions import create_folders
+from tools.folder_creator.functions import iter_create_folders
 
 
 class FolderCreatorWorker(QObject):
@@ -27,6 +28,18 @@ class FolderCreatorWorker(QObject):
     ) -> None:
         super().__init__()
         self.logger = get_tool_logger("folder_creator")
+        self.configure(parent_path, count, prefix, suffix, padding, start_index)
+
+    def configure(
+        self,
+        parent_path: Path,
+        count: int,
+        prefix: str,
+        suffix: str,
+        padding: int,
+        start_index: int,
+    ) -> None:
+        """작업 설정 변경 (같은 Worker를 다음 실행에 재사용할 때 호출)"""
         self.parent_path = parent_path
         self.count = count
         self.prefix = prefix
@@ -48,28 +61,52 @@ class FolderCreatorWorker(QObject):
             self.progress.emit(0, self.count)
             self.progressed.emit(f"Creating {self.count} folders in {self.parent_path}...\n")
             
-            # 폴더 생성
-            created_folders = create_folders(
-                self.parent_path,
-                self.count,
-                self.prefix,
-                self.suffix,
-                self.padding,
-                self.start_index,
-            )
+            # 폴더 생성과 진행률 보고를 한 번의 순회로 처리
+            # (항목마다 시그널을 보내지 않고 약 200회로 묶어서 요약만 전송)
+            total = self.count
+            step = max(1, total // 200)
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            created = 0
+            for created, folder in enumerate(
+                iter_create_folders(
+                    self.parent_path,
+                    self.count,
+                    self.prefix,
+                    self.suffix,
+                    self.padding,
+                    self.start_index,
+                ),
+                1,
+            ):
+                if debug:
+                    self.logger.debug("Created: %s", folder.name)
+                if created % step == 0 or created == total:
+                    self.progress.emit(created, total)
+                    self.progressed.emit(f"Created {created}/{total} (last: {folder.name})")
             
-            # 진행률 업데이트
-            for i, folder in enumerate(created_folders, 1):
-                self.progress.emit(i, self.count)
-                self.progressed.emit(f"Created: {folder.name}\n")
-            
-            self.logger.info("Task completed: %d folders created successfully", len(created_folders))
-            self.finished.emit(len(created_folders))
+            self.logger.info("Task completed: %d folders created successfully", created)
+            self.finished.emit(created)
         except Exception as e:  # noqa: BLE001
             self.logger.error("Task failed: %s", str(e), exc_info=True)
             self.failed.emit(str(e))
 
 
+class FolderCreatorRunnable(QRunnable):
+    """FolderCreatorWorker를 QThreadPool에서 실행하기 위한 QRunnable
+
+    작업마다 QThread를 만들지 않고 전역 스레드 풀의 스레드를 재사용합니다.
+    시그널은 GUI 스레드에 있는 worker 객체에서 발생하므로
+    연결된 슬롯은 자동으로 GUI 스레드에서 (queued) 호출됩니다.
+    """
+
+    def __init__(self, worker: FolderCreatorWorker) -> None:
+        super().__init__()
+        self.worker = worker
+
+    def run(self) -> None:
+        self.worker.run()
+
+
 # CLI 테스트 지원
 if __name__ == "__main__":
     import sys
@@ -103,7 +140,7 @@ if __name__ == "__main__":
     
     # 시그널 연결
     def on_progressed(text: str):
-        print(text, end='')
+        print(text.rstrip("\n"))
     
     def on_progress(current: int, total: int):
         print(f"\rProgress: {current}/{total} ({current*100//total if total > 0 else 0}%)", end='', flush=True)
@@ -1,20 +1,17 @@
 """파일명 일괄 변경 도구"""
 from __future__ import annotations
 
-from tools import ToolInfo
+from tools import get_tool_info
 from tools.common.log_utils import get_tool_logger
 
 __all__ = ["RenamerTool", "RENAMER_INFO"]
 
 logger = get_tool_logger("renamer")
 
-RENAMER_INFO = ToolInfo(
-    name="파일명 변경 도구",
-    description="이미지 파일명을 일괄적으로 변경하는 도구",
-    icon=None,
-)
+# 이름/설명은 tool.toml에서 읽어 등록된 값을 그대로 사용
+RENAMER_INFO = get_tool_info("renamer")
 
-logger.debug("RENAMER_INFO created for tool_id=%s", "renamer")
+logger.debug("RENAMER_INFO loaded for tool_id=%s", "renamer")
 
 
 class RenamerTool:
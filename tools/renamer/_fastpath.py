@@ -0,0 +1,41 @@
+"""Numba로 컴파일한 인덱스/선택 계산 (선택 기능)
+
+numba 패키지(`pip install numba`)가 설치되어 있을 때만 사용 가능합니다.
+설치되어 있지 않으면 import 시 ImportError가 발생하며,
+gui에서는 numpy / 순수 Python 계산으로 대체합니다.
+"""
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def assign_indices(group_sizes, base, reset_per_folder):
+    """그룹 크기 배열로 파일별 인덱스 배열 생성
+
+    Args:
+        group_sizes: 폴더(그룹)별 파일 개수 (int64 배열, 표시 순서)
+        base: 시작 인덱스
+        reset_per_folder: True면 그룹마다 base부터 다시 시작
+
+    Returns:
+        모든 그룹을 이어 붙인 순서의 인덱스 (int64 배열)
+    """
+    out = np.empty(group_sizes.sum(), np.int64)
+    k = 0
+    cur = base
+    for gs in group_sizes:
+        if reset_per_folder:
+            cur = base
+        for _ in range(gs):
+            out[k] = cur
+            k += 1
+            cur += 1
+    return out
+
+
+@njit(cache=True)
+def selection_mask(idx, off, div):
+    """(idx - off) % div == 0 인 항목 마스크 (div는 1 이상)"""
+    return (idx - off) % div == 0
@@ -0,0 +1,91 @@
+"""io_uring 기반 일괄 rename (Linux 전용, 선택 기능)
+
+python-liburing 패키지(`pip install liburing`)가 설치된 Linux에서만 사용 가능합니다.
+renameat 요청을 한 번에 제출하고 완료를 모아서 받으므로
+파일마다 시스템 콜을 따로 호출하지 않습니다.
+
+환경 변수 RENAMER_URING=1 로 켰을 때만 이동(move) 작업에서 사용됩니다.
+"""
+from __future__ import annotations
+
+import errno
+import os
+import sys
+
+if not sys.platform.startswith("linux"):
+    raise ImportError("io_uring is only available on Linux")
+
+import liburing  # noqa: E402  (플랫폼 확인 후 import)
+from liburing import (  # noqa: E402
+    AT_FDCWD,
+    io_uring,
+    io_uring_cqe,
+    io_uring_cqe_seen,
+    io_uring_get_sqe,
+    io_uring_prep_renameat,
+    io_uring_queue_exit,
+    io_uring_queue_init,
+    io_uring_submit,
+    io_uring_wait_cqe,
+)
+
+QUEUE_DEPTH = 256
+RENAME_NOREPLACE = 1  # renameat2 플래그: 대상이 있으면 EEXIST
+
+# 한 스레드에서만 제출하고 완료 처리도 제출 시점에 하므로 커널의 스레드 간 알림을 줄이는 설정
+# (바인딩에 상수가 없으면 0, 커널이 지원하지 않으면 플래그 없이 다시 초기화)
+_SETUP_FLAGS = (
+    getattr(liburing, "IORING_SETUP_SINGLE_ISSUER", 0)
+    | getattr(liburing, "IORING_SETUP_COOP_TASKRUN", 0)
+)
+
+
+def _queue_init(depth: int, ring) -> None:
+    """io_uring 초기화 (_SETUP_FLAGS를 지원하지 않는 커널이면 플래그 없이 초기화)"""
+    if _SETUP_FLAGS:
+        try:
+            io_uring_queue_init(depth, ring, _SETUP_FLAGS)
+            return
+        except OSError as e:
+            if e.errno != errno.EINVAL:
+                raise
+    io_uring_queue_init(depth, ring, 0)
+
+
+def batch_rename(pairs: list[tuple[str, str]], overwrite: bool = False) -> list[int]:
+    """pairs의 (원본, 대상) 경로를 io_uring으로 rename
+
+    대상 폴더는 호출 측에서 미리 만들어 두어야 합니다.
+
+    Args:
+        pairs: (원본 경로, 대상 경로) 목록
+        overwrite: False면 대상이 이미 있을 때 덮어쓰지 않음 (-EEXIST 결과)
+
+    Returns:
+        pairs와 같은 순서의 결과 코드 (0이면 성공, 음수면 -errno)
+        (-EXDEV 등 실패 항목은 호출 측에서 일반 경로로 다시 처리)
+    """
+    results = [0] * len(pairs)
+    flags = 0 if overwrite else RENAME_NOREPLACE
+    ring = io_uring()
+    cqe = io_uring_cqe()
+    _queue_init(min(QUEUE_DEPTH, max(1, len(pairs))), ring)
+    try:
+        for start in range(0, len(pairs), QUEUE_DEPTH):
+            chunk = pairs[start:start + QUEUE_DEPTH]
+            # 제출한 요청이 완료될 때까지 경로 bytes가 살아 있어야 함
+            encoded = [(os.fsencode(s), os.fsencode(d)) for s, d in chunk]
+            for i, (src, dst) in enumerate(encoded):
+                sqe = io_uring_get_sqe(ring)
+                io_uring_prep_renameat(sqe, AT_FDCWD, src, AT_FDCWD, dst, flags)
+                sqe.user_data = i
+            io_uring_submit(ring)
+
+            for _ in range(len(encoded)):
+                io_uring_wait_cqe(ring, cqe)
+                res, idx = cqe.res, cqe.user_data
+                io_uring_cqe_seen(ring, cqe)
+                results[start + idx] = min(res, 0)
+    finally:
+        io_uring_queue_exit(ring)
+    return results
@@ -2,10 +2,21 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Callable, Iterable
+
+try:
+    import numpy as np
+except ImportError:  # numpy 미설치 시 순수 Python으로 계산
+    np = None
 
 # Windows 파일명에 사용 불가 문자
-INVALID_FILENAME_CHARS = set('\\/:*?"<>|')
+_INVALID_CHARS = '\\/:*?"<>|'
+INVALID_FILENAME_CHARS = set(_INVALID_CHARS)
+# 사용 불가 문자를 제거하는 translate 테이블 (길이가 달라지면 포함된 것)
+_INVALID_TABLE = str.maketrans('', '', _INVALID_CHARS)
 MAX_FILENAME_LEN = 255
+# build_new_names_bulk에서 numpy로 인덱스를 계산하는 최소 개수
+_BULK_NUMPY_MIN = 512
 
 
 def build_parent_folder_prefix(rel_parent: Path) -> str:
@@ -35,9 +46,9 @@ def validate_parent_folder_prefix(rel_parent: Path, new_name: str) -> tuple[bool
         return True, ""
     
     for part in rel_parent.parts:
-        for c in INVALID_FILENAME_CHARS:
-            if c in part:
-                return False, f"폴더 이름에 사용할 수 없는 문자가 포함되어 있습니다: '{part}' (문자 '{c}')"
+        if len(part.translate(_INVALID_TABLE)) != len(part):
+            c = next(ch for ch in part if ch in INVALID_FILENAME_CHARS)
+            return False, f"폴더 이름에 사용할 수 없는 문자가 포함되어 있습니다: '{part}' (문자 '{c}')"
         if not part.strip():
             return False, "폴더 이름이 비어 있을 수 없습니다."
     
@@ -50,6 +61,101 @@ def validate_parent_folder_prefix(rel_parent: Path, new_name: str) -> tuple[bool
     return True, ""
 
 
+def make_new_name_builder(
+    pad_width: int,
+    index_mul: float,
+    index_offset: int,
+    prefix: str,
+    postfix: str,
+) -> Callable[[int, str], str]:
+    """새 규칙 파일명 생성 함수를 만들어 반환 (build_new_name의 일괄 처리용)
+    
+    prefix/postfix 정리, 구분자 결정, 숫자 형식 구성을 한 번만 수행하고
+    반환된 함수는 인덱스와 확장자만 받아 파일명을 만듭니다.
+    
+    Returns:
+        build(index_value, suffix) -> 파일명
+        
+    Example:
+        >>> build = make_new_name_builder(4, 1.0, 0, "frame", "")
+        >>> build(1, ".bmp")
+        "frame_0001.bmp"
+    """
+    mul = 0.0 if index_mul is None else float(index_mul)
+    off = 0 if index_offset is None else index_offset
+    
+    if pad_width is None or pad_width < 0:
+        pad_width = 0
+    
+    px = (prefix or "").strip()
+    post = (postfix or "").strip()
+    head = f"{px}{'' if px.endswith(('_', '-')) else '_'}" if px else ""
+    tail = f"{'' if post.startswith(('_', '-')) else '_'}{post}" if post else ""
+
+    # 조각을 + 로 이어 붙이면 중간 문자열이 매번 생기므로 f-string으로 한 번에 조립
+    if pad_width == 0:
+        def build(index_value: int, suffix: str) -> str:
+            return f"{head}{int(round(index_value * mul + off))}{tail}{suffix}"
+    else:
+        # str.zfill은 f"{n:0{w}d}"와 동일하게 부호를 포함한 너비로 채움 (-5 -> "-005")
+        def build(index_value: int, suffix: str) -> str:
+            return f"{head}{str(int(round(index_value * mul + off))).zfill(pad_width)}{tail}{suffix}"
+    
+    return build
+
+
+def build_new_names_bulk(
+    index_values: Iterable[int],
+    suffix: str,
+    pad_width: int,
+    index_mul: float,
+    index_offset: int,
+    prefix: str,
+    postfix: str,
+) -> list[str]:
+    """여러 인덱스에 대한 새 규칙 파일명을 한 번에 생성
+    
+    인덱스 계산(index * mul + offset 후 반올림)은 numpy로 한 번에 처리하고
+    문자열 조립만 Python에서 수행합니다. 결과는 build_new_name과 동일합니다
+    (np.rint와 round 모두 0.5는 짝수 쪽으로 반올림).
+    numpy가 없거나 개수가 적으면 (배열 변환 비용이 더 큼) make_new_name_builder로 하나씩 생성합니다.
+    
+    Example:
+        >>> build_new_names_bulk(range(1, 4), ".bmp", 4, 1.0, 0, "frame", "")
+        ["frame_0001.bmp", "frame_0002.bmp", "frame_0003.bmp"]
+    """
+    index_values = list(index_values)
+    if np is None or len(index_values) < _BULK_NUMPY_MIN:
+        build = make_new_name_builder(pad_width, index_mul, index_offset, prefix, postfix)
+        return [build(i, suffix) for i in index_values]
+    
+    arr = np.fromiter(index_values, dtype=np.int64, count=len(index_values))
+    mul = 0.0 if index_mul is None else float(index_mul)
+    off = 0 if index_offset is None else index_offset
+    computed = np.rint(arr.astype(np.float64) * mul + off).astype(np.int64)
+    
+    # 인덱스 변환은 위에서 끝났으므로 mul=1, offset=0으로 문자열만 조립
+    build = make_new_name_builder(pad_width, 1.0, 0, prefix, postfix)
+    return [build(x, suffix) for x in computed.tolist()]
+
+
+def make_keep_name_builder(prefix: str, postfix: str) -> Callable[[str, str], str]:
+    """현재 이름 유지 파일명 생성 함수를 만들어 반환 (build_keep_name의 일괄 처리용)
+    
+    Returns:
+        build(original_stem, suffix) -> 파일명
+    """
+    px = (prefix or "").strip()
+    post = (postfix or "").strip()
+    head = f"{px}{'' if px.endswith(('_', '-')) else '_'}" if px else ""
+    tail = f"{'' if post.startswith(('_', '-')) else '_'}{post}" if post else ""
+    
+    def build(original_stem: str, suffix: str) -> str:
+        return f"{head}{original_stem}{tail}{suffix}"
+    
+    return build
+
+
 def build_new_name(
     index_value: int,
     suffix: str,
@@ -61,6 +167,8 @@ def build_new_name(
 ) -> str:
     """새로운 규칙으로 파일명 생성
     
+    여러 파일에 같은 설정을 적용할 때는 make_new_name_builder를 사용하세요.
+    
     Args:
         index_value: 인덱스 값
         suffix: 파일 확장자 (예: ".bmp")
@@ -77,37 +185,14 @@ def build_new_name(
         >>> build_new_name(1, ".bmp", 4, 1.0, 0, "frame", "")
         "frame_0001.bmp"
     """
-    mul = 0.0 if index_mul is None else float(index_mul)
-    off = 0 if index_offset is None else index_offset
-    computed_float = index_value * mul + off
-    computed = int(round(computed_float))
-    
-    if pad_width is None or pad_width < 0:
-        pad_width = 0
-    
-    if pad_width == 0:
-        num_str = f"{computed}"
-    else:
-        num_str = f"{computed:0{pad_width}d}"
-
-    px = (prefix or "").strip()
-    if px:
-        sep = "" if px.endswith(("_", "-")) else "_"
-        base = f"{px}{sep}{num_str}"
-    else:
-        base = num_str
-
-    post = (postfix or "").strip()
-    if post:
-        sep2 = "" if post.startswith(("_", "-")) else "_"
-        base = f"{base}{sep2}{post}"
-
-    return f"{base}{suffix}"
+    return make_new_name_builder(pad_width, index_mul, index_offset, prefix, postfix)(index_value, suffix)
 
 
 def build_keep_name(original_stem: str, suffix: str, prefix: str, postfix: str) -> str:
     """원본 파일명을 유지하면서 prefix와 postfix를 추가
     
+    여러 파일에 같은 설정을 적용할 때는 make_keep_name_builder를 사용하세요.
+    
     Args:
         original_stem: 원본 파일명 (확장자 제외)
         suffix: 파일 확장자 (예: ".bmp")
@@ -121,22 +206,7 @@ def build_keep_name(original_stem: str, suffix: str, prefix: str, postfix: str)
         >>> build_keep_name("original_file", ".bmp", "pre_", "_post")
         "pre_original_file_post.bmp"
     """
-    px = (prefix or "").strip()
-    post = (postfix or "").strip()
-    
-    # prefix 추가
-    if px:
-        sep = "" if px.endswith(("_", "-")) else "_"
-        base = f"{px}{sep}{original_stem}"
-    else:
-        base = original_stem
-    
-    # postfix 추가
-    if post:
-        sep2 = "" if post.startswith(("_", "-")) else "_"
-        base = f"{base}{sep2}{post}"
-    
-    return f"{base}{suffix}"
+    return make_keep_name_builder(prefix, postfix)(original_stem, suffix)
 
 
 # CLI 테스트 지원
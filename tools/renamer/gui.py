@@ -2,56 +2,196 @@
 """Renamer 도구의 GUI"""
 from __future__ import annotations
 
+import functools
 import json
+import os
 import sys
+from contextlib import contextmanager
+from operator import itemgetter
 from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Mapping
 
-from PySide6.QtCore import QThread, Signal, Slot, Qt
+from PySide6.QtCore import QThreadPool, QTimer, Signal, Slot, Qt
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
     QMessageBox,
     QFileDialog,
     QHeaderView,
+    QStyledItemDelegate,
     QTreeWidget,
     QTreeWidgetItem,
 )
 from PySide6.QtGui import QColor, QBrush
 
-from tools.common.file_utils import list_files
-from tools.common.path_utils import natural_sort_key
+try:
+    import numpy as np
+except ImportError:  # numpy 미설치 시 순수 Python으로 계산
+    np = None
+
+try:
+    from tools.renamer._fastpath import assign_indices, selection_mask
+except ImportError:  # numba 미설치 시 numpy / 순수 Python으로 계산
+    assign_indices = selection_mask = None
+
+from tools.common.file_utils import list_files_fast
+from tools.common.path_utils import natural_sort_key_str
 from tools.common.ui_utils import load_ui_file
 from tools.common.log_utils import get_tool_logger
-from tools.renamer.pipeline import RenamerWorker
+from tools.renamer.pipeline import RenamerRunnable, RenamerWorker, ScanWorker
 from tools.renamer.functions import (
-    build_new_name,
-    build_keep_name,
+    make_new_name_builder,
+    make_keep_name_builder,
+    build_new_names_bulk,
     build_parent_folder_prefix,
     validate_parent_folder_prefix,
 )
 
 
+@functools.lru_cache(maxsize=1)
+def _load_constants_cached() -> Mapping:
+    """constants.json 로드 (최초 1회만 읽고 이후 윈도우에서는 재사용)
+
+    캐시된 값이 변경되지 않도록 읽기 전용 Mapping으로 반환합니다.
+    """
+    config_path = Path(__file__).parent / 'constants.json'
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return MappingProxyType(json.load(f))
+
+
+# 파일 트리 행의 선택(하이라이트) 여부를 저장하는 role (0번 열에만 저장)
+_HIGHLIGHT_ROLE = Qt.UserRole + 1
+
+
+class HighlightDelegate(QStyledItemDelegate):
+    """선택된 행을 하이라이트 배경으로 그리는 delegate
+    
+    열마다 setBackground를 호출하지 않고 0번 열의 _HIGHLIGHT_ROLE 값 하나로
+    행 전체의 배경을 결정합니다.
+    """
+    # 모든 행/인스턴스가 같은 브러시를 공유 (그릴 때마다 새로 만들지 않음)
+    _HL_BRUSH = QBrush(QColor(255, 255, 200))
+    
+    def initStyleOption(self, option, index) -> None:
+        super().initStyleOption(option, index)
+        if index.siblingAtColumn(0).data(_HIGHLIGHT_ROLE):
+            option.backgroundBrush = self._HL_BRUSH
+
+
+@contextmanager
+def _batch_tree_update(tree: QTreeWidget):
+    """트리 항목을 한꺼번에 바꾸는 동안 다시 그리기, 시그널, 정렬, 열 자동 크기 조정을 멈춤"""
+    sorting = tree.isSortingEnabled()
+    header = tree.header()
+    # ResizeToContents 열은 항목이 추가될 때마다 전체 너비를 다시 재므로 작업 중에는 고정
+    auto_cols = [
+        col for col in range(header.count())
+        if header.sectionResizeMode(col) == QHeaderView.ResizeToContents
+    ]
+    for col in auto_cols:
+        header.setSectionResizeMode(col, QHeaderView.Interactive)
+    tree.setUpdatesEnabled(False)
+    tree.blockSignals(True)
+    tree.setSortingEnabled(False)
+    try:
+        yield
+    finally:
+        tree.setSortingEnabled(sorting)
+        tree.blockSignals(False)
+        # 원래 모드로 되돌리면 너비를 한 번만 다시 계산함
+        for col in auto_cols:
+            header.setSectionResizeMode(col, QHeaderView.ResizeToContents)
+        tree.setUpdatesEnabled(True)
+
+
+def _folder_item(
+    parts: tuple[str, ...],
+    path_to_item: dict[tuple[str, ...], QTreeWidgetItem],
+    top_items: list[QTreeWidgetItem],
+) -> QTreeWidgetItem:
+    """parts 경로의 폴더 아이템 반환 (없으면 중간 폴더까지 만들어 연결)"""
+    item = path_to_item.get(parts)
+    if item is not None:
+        return item
+    item = QTreeWidgetItem([parts[-1]])
+    path_to_item[parts] = item
+    if len(parts) > 1:
+        _folder_item(parts[:-1], path_to_item, top_items).addChild(item)
+    else:
+        top_items.append(item)
+    return item
+
+
+def _rel_parent_getter(folder: Path) -> Callable[[Path], Path]:
+    """folder 기준 상대 부모 경로를 구하는 함수 반환
+    
+    스캔 결과 경로는 모두 folder로 시작하므로 relative_to 대신 문자열을 잘라 구하고,
+    같은 부모 폴더의 Path는 한 번만 만듭니다 (루트 바로 아래 파일은 Path(".")).
+    """
+    root = os.fspath(folder)
+    cut = len(root) if root.endswith(os.sep) else len(root) + 1
+    cache: dict[str, Path] = {}
+    
+    def rel_parent(p: Path) -> Path:
+        parent = os.path.dirname(os.fspath(p))
+        rel = cache.get(parent)
+        if rel is None:
+            rel = cache[parent] = Path(parent[cut:])
+        return rel
+    
+    return rel_parent
+
+
+def _parts_sort_key(parts: tuple[str, ...]) -> tuple[str, ...]:
+    """폴더 경로 정렬 키 (대소문자 무시)"""
+    return tuple(part.lower() for part in parts)
+
+
 class RenamerWindow(QMainWindow):
     """파일명 변경 도구 GUI"""
     
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.logger = get_tool_logger("renamer")
-        self.constants = self._load_constants()
+        self.constants = _load_constants_cached()
+        # 자주 조회하는 표시값/매핑은 미리 꺼내 둠
+        self._rename_modes_display: list[str] = self.constants.get('rename_modes', {}).get('display', [])
+        self._rename_modes_mapping: dict[str, str] = self.constants.get('rename_modes', {}).get('mapping', {})
+        self._output_modes_display: list[str] = self.constants.get('output_modes', {}).get('display', [])
+        self._index_base_display: list[str] = self.constants.get('index_base_options', {}).get('display', [])
+        self._index_base_mapping: dict[str, int] = self.constants.get('index_base_options', {}).get('mapping', {})
+        # 선택 규칙 위젯이 연속으로 바뀌면 마지막 변경 후 한 번만 트리 갱신
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(80)
+        self._refresh_timer.timeout.connect(self._do_selection_refresh)
+        self._combo_items: dict[str, tuple[str, ...]] = {}  # objectName -> 마지막으로 설정한 항목
         self._load_ui()
         self._apply_config_to_ui()
         self._connect()
 
-        self.thread: QThread | None = None
+        # 스캔/미리보기/실행은 한 번에 하나만 실행되므로 스레드 하나를 계속 재사용
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._pool.setExpiryTimeout(-1)
         self.worker: RenamerWorker | None = None
+        self.scan_worker: ScanWorker | None = None
+        # 파일 트리의 파일 항목과 인덱스 (하이라이트 갱신용, _populate_tree에서 채움)
+        self._tree_items: list[QTreeWidgetItem] = []
+        self._tree_indices = []
+        self._prev_selected = []
+        # 마지막 스캔 결과 {"folder", "pattern", "sorted_groups"} (폴더/패턴이 같으면 재사용)
+        self._scan_cache: dict = {}
+        # 미리보기 트리 항목 인덱스 ((목적지 폴더 parts, 원본 경로) -> 아이템, 변경분만 갱신할 때 사용)
+        self._preview_index: dict[tuple[tuple[str, ...], Path], QTreeWidgetItem] = {}
+        self._preview_folders: dict[tuple[str, ...], QTreeWidgetItem] = {}
+        self._preview_folders_with_files: set[tuple[str, ...]] = set()
+        self._preview_root_name: str | None = None
+        self._plan_root_name = "."  # 마지막으로 시작한 Worker의 미리보기 루트 이름
+        self._run_modifies_files = False
         self.logger.info("RenamerWindow initialized")
 
-    def _load_constants(self) -> dict:
-        """constants.json 로드"""
-        config_path = Path(__file__).parent / 'constants.json'
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-
     def _load_ui(self) -> None:
         """Designer .ui 파일 로드
         
@@ -72,6 +212,9 @@ class RenamerWindow(QMainWindow):
             if tree_preview is not None:
                 self.tree_preview_structure = tree_preview
         
+        # 선택된 행 하이라이트는 delegate가 그림
+        self.tree.setItemDelegate(HighlightDelegate(self.tree))
+        
         # Tree (파일명을 보여주는 table)의 위젯 헤더 설정 (Designer에서 완전히 설정 불가)
         self.tree.header().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.tree.header().setSectionResizeMode(1, QHeaderView.Stretch)
@@ -86,6 +229,37 @@ class RenamerWindow(QMainWindow):
         if hasattr(self, 'tree_preview_structure'):
             self.tree_preview_structure.setHeaderLabel("파일/폴더")
             self.tree_preview_structure.setRootIsDecorated(True)
+        
+        # .ui 버전에 따라 없을 수 있는 위젯은 한 번만 확인해 두고 None으로 구분
+        self._preserve_widget = getattr(self, 'chk_preserve_folder_structure', None)
+        self._parent_prefix_widget = getattr(self, 'chk_add_parent_folder_prefix', None)
+        
+        # 실행 중 비활성화할 위젯 목록 (_set_running에서 사용)
+        self._running_widgets = [
+            self.edit_folder,
+            self.btn_browse,
+            self.edit_pattern,
+            self.combo_rename_mode,
+            self.combo_index_base,
+            self.edit_prefix,
+            self.edit_postfix,
+            self.spin_pad,
+            self.spin_index_mul,
+            self.spin_index_offset,
+            self.combo_output_mode,
+            self.edit_dst,
+            self.btn_dst_browse,
+            self.chk_move,
+            self.chk_overwrite,
+            self.chk_preserve_meta,
+            self.chk_dry,
+            self.chk_verbose,
+            self.chk_reset_per_folder,
+            self.btn_preview,
+            self.btn_run,
+        ]
+        if self._preserve_widget is not None and self._parent_prefix_widget is not None:
+            self._running_widgets += [self._preserve_widget, self._parent_prefix_widget]
 
     def _apply_config_to_ui(self) -> None:
         """constants.json의 설정을 UI에 적용 (ComboBox 항목만)
@@ -93,44 +267,32 @@ class RenamerWindow(QMainWindow):
         주의: GUI 기본값, 범위, 체크박스 상태는 모두 Designer에서 설정한 것을 사용
         """
         # ComboBox 항목 설정
-        if hasattr(self, 'combo_rename_mode'):
-            rename_modes = self.constants.get('rename_modes', {}).get('display', [])
-            if self.combo_rename_mode.count() == 0 or [self.combo_rename_mode.itemText(i) for i in range(self.combo_rename_mode.count())] != rename_modes:
-                current_text = self.combo_rename_mode.currentText()
-                self.combo_rename_mode.clear()
-                self.combo_rename_mode.addItems(rename_modes)
-                if current_text and current_text in rename_modes:
-                    self.combo_rename_mode.setCurrentText(current_text)
-                elif rename_modes:
-                    self.combo_rename_mode.setCurrentIndex(0)
-        
-        if hasattr(self, 'combo_output_mode'):
-            output_modes = self.constants.get('output_modes', {}).get('display', [])
-            if self.combo_output_mode.count() == 0 or [self.combo_output_mode.itemText(i) for i in range(self.combo_output_mode.count())] != output_modes:
-                current_text = self.combo_output_mode.currentText()
-                self.combo_output_mode.clear()
-                self.combo_output_mode.addItems(output_modes)
-                if current_text and current_text in output_modes:
-                    self.combo_output_mode.setCurrentText(current_text)
-                elif output_modes:
-                    self.combo_output_mode.setCurrentIndex(0)
-        
-        if hasattr(self, 'combo_index_base'):
-            index_base_options = self.constants.get('index_base_options', {}).get('display', [])
-            if self.combo_index_base.count() == 0 or [self.combo_index_base.itemText(i) for i in range(self.combo_index_base.count())] != index_base_options:
-                current_text = self.combo_index_base.currentText()
-                self.combo_index_base.clear()
-                self.combo_index_base.addItems(index_base_options)
-                if current_text and current_text in index_base_options:
-                    self.combo_index_base.setCurrentText(current_text)
-                elif index_base_options:
-                    self.combo_index_base.setCurrentIndex(0)
+        self._fill_combo(getattr(self, 'combo_rename_mode', None), self._rename_modes_display)
+        self._fill_combo(getattr(self, 'combo_output_mode', None), self._output_modes_display)
+        self._fill_combo(getattr(self, 'combo_index_base', None), self._index_base_display)
         
         # 참고: 
         # - GUI 기본값(prefix, postfix, pad_width, 체크박스 상태 등)은 Designer에서 설정
         # - 범위(min/max)도 Designer에서 설정
         # - constants.json은 GUI 표시값 <-> 메서드명 매핑만 포함
 
+    def _fill_combo(self, combo, items: list[str]) -> None:
+        """ComboBox 항목을 items로 설정 (이미 같은 항목이면 그대로 둠)"""
+        if combo is None:
+            return
+        items = tuple(items)
+        if self._combo_items.get(combo.objectName()) == items:
+            return
+        if combo.count() == 0 or tuple(combo.itemText(i) for i in range(combo.count())) != items:
+            current_text = combo.currentText()
+            combo.clear()
+            combo.addItems(list(items))
+            if current_text and current_text in items:
+                combo.setCurrentText(current_text)
+            elif items:
+                combo.setCurrentIndex(0)
+        self._combo_items[combo.objectName()] = items
+
     def _connect(self) -> None:
         """시그널-슬롯 연결"""
         self.btn_browse.clicked.connect(self._on_browse)
@@ -146,8 +308,8 @@ class RenamerWindow(QMainWindow):
         self.chk_apply_selection.toggled.connect(self._on_selection_changed)
         self.combo_index_base.currentIndexChanged.connect(self._on_selection_changed)
         self.chk_reset_per_folder.toggled.connect(self._on_selection_changed)
-        if hasattr(self, 'chk_preserve_folder_structure'):
-            self.chk_preserve_folder_structure.toggled.connect(self._update_add_parent_folder_prefix_visibility)
+        if self._preserve_widget is not None:
+            self._preserve_widget.toggled.connect(self._update_add_parent_folder_prefix_visibility)
 
         self._update_output_mode()
         self._update_rename_mode()
@@ -160,18 +322,18 @@ class RenamerWindow(QMainWindow):
         if path:
             self.edit_folder.setText(path)
 
-    def _validate(self) -> tuple[Path, str, str, int, int, float, int, str, str, bool, int, int, bool, bool, bool, bool, Path | None, bool, bool, bool, bool] | None:
+    def _validate(self) -> tuple[Path, str, str, int, int, float, int, str, str, bool, int, int, bool, bool, bool, bool, Path | None, bool, bool, bool, bool, bool] | None:
         """입력값 검증 및 GUI 값 -> 라이브러리 메서드명 매핑"""
         folder = Path(self.edit_folder.text().strip())
         pattern = self.edit_pattern.text().strip() or "*"
         
         # GUI 표시값을 라이브러리 메서드명으로 매핑
         rename_mode_display = self.combo_rename_mode.currentText()
-        rename_method = self.constants.get('rename_modes', {}).get('mapping', {}).get(rename_mode_display, 'build_new_name')
+        rename_method = self._rename_modes_mapping.get(rename_mode_display, 'build_new_name')
         
         # index_base 매핑
         index_base_display = self.combo_index_base.currentText()
-        index_base = self.constants.get('index_base_options', {}).get('mapping', {}).get(index_base_display, 1)
+        index_base = self._index_base_mapping.get(index_base_display, 1)
         pad_width = int(self.spin_pad.value())
         index_mul = float(self.spin_index_mul.value())
         index_offset = int(self.spin_index_offset.value())
@@ -182,10 +344,10 @@ class RenamerWindow(QMainWindow):
         sel_division = int(self.spin_sel_div.value())
         reset_per_folder = self.chk_reset_per_folder.isChecked()
         preserve_tree = self.combo_output_mode.currentIndex() == 1
-        preserve_folder_structure = self.chk_preserve_folder_structure.isChecked() if hasattr(self, 'chk_preserve_folder_structure') else True
+        preserve_folder_structure = self._preserve_widget.isChecked() if self._preserve_widget is not None else True
         add_parent_folder_prefix = (
-            hasattr(self, 'chk_add_parent_folder_prefix')
-            and self.chk_add_parent_folder_prefix.isChecked()
+            self._parent_prefix_widget is not None
+            and self._parent_prefix_widget.isChecked()
         )
         dest_root: Path | None = None
         if preserve_tree:
@@ -198,33 +360,31 @@ class RenamerWindow(QMainWindow):
         overwrite = self.chk_overwrite.isChecked()
         dry_run = self.chk_dry.isChecked()
         verbose = self.chk_verbose.isChecked()
+        preserve_meta = self.chk_preserve_meta.isChecked()
 
-        if not folder.exists() or not folder.is_dir():
+        if not folder.is_dir():
             QMessageBox.warning(self, "경고", "유효한 폴더를 선택하세요.")
             return None
 
         # 상위 폴더 prefix 사용 시: 모든 파일에 대해 prefix 검증
         if preserve_tree and not preserve_folder_structure and add_parent_folder_prefix:
-            paths = list_files(folder, pattern, recursive=True)
-            if not paths:
+            sorted_groups = self._get_sorted_groups(folder, pattern)
+            if not sorted_groups:
                 QMessageBox.warning(self, "경고", "대상 파일이 없습니다.")
                 return None
-            pairs = self._compute_pairs_for_ui(paths)
+            pairs = self._compute_pairs_for_ui(sorted_groups)
             if apply_selection and sel_division and sel_division > 0:
                 pairs = [(p, i) for (p, i) in pairs if (i - sel_offset) % sel_division == 0]
+            keep_name = self._keep_name
+            build_func = self._make_build_func(pad_width, index_mul, index_offset, prefix, postfix)
+            rel_parent_of = _rel_parent_getter(folder)
             for src, index_value in pairs:
                 suffix = src.suffix
-                if rename_method == "build_keep_name":
-                    base_name = build_keep_name(src.stem, suffix, prefix, postfix)
+                if keep_name:
+                    base_name = build_func(src.stem, suffix)
                 else:
-                    base_name = build_new_name(
-                        index_value, suffix, pad_width, index_mul, index_offset, prefix, postfix
-                    )
-                try:
-                    rel_parent = src.parent.relative_to(folder)
-                except Exception:
-                    rel_parent = Path("")
-                ok, err = validate_parent_folder_prefix(rel_parent, base_name)
+                    base_name = build_func(index_value, suffix)
+                ok, err = validate_parent_folder_prefix(rel_parent_of(src), base_name)
                 if not ok:
                     QMessageBox.warning(
                         self,
@@ -255,6 +415,7 @@ class RenamerWindow(QMainWindow):
             overwrite,
             dry_run,
             verbose,
+            preserve_meta,
         )
 
     def _start_worker(self, *, dry_run_override: bool | None = None) -> None:
@@ -285,16 +446,17 @@ class RenamerWindow(QMainWindow):
             overwrite,
             dry_run,
             verbose,
+            preserve_meta,
         ) = validated
 
         if dry_run_override is not None:
             dry_run = dry_run_override
 
+        self._run_modifies_files = not dry_run
         self._set_running(True)
         self.log.appendPlainText("작업 시작...")
         self.logger.info("User started renaming task: folder=%s, pattern=%s", folder, pattern)
 
-        self.thread = QThread(self)
         self.worker = RenamerWorker(
             folder=folder,
             pattern=pattern,
@@ -317,21 +479,20 @@ class RenamerWindow(QMainWindow):
             overwrite=overwrite,
             dry_run=dry_run,
             verbose=verbose,
+            preserve_meta=preserve_meta,
         )
-        self.worker.moveToThread(self.thread)
-        self.thread.started.connect(self.worker.run)
+        # 미리보기 트리 루트 이름 (plan_ready 수신 시 사용)
+        self._plan_root_name = dest_root.name if (preserve_tree and dest_root) else "."
+        self.worker.plan_ready.connect(self._render_preview_from_plan)
         self.worker.progressed.connect(self._on_progress)
         self.worker.progress.connect(self._on_progress_update)
         self.worker.finished.connect(self._on_finished)
         self.worker.failed.connect(self._on_failed)
-        self.thread.start()
+        self._pool.start(RenamerRunnable(self.worker))
 
     @Slot()
     def _on_preview(self) -> None:
-        """미리보기 실행"""
-        # 미리보기 트리 업데이트
-        self._update_preview_tree()
-        # 기존 미리보기 로직 실행
+        """미리보기 실행 (미리보기 트리는 Worker의 plan_ready 결과로 갱신)"""
         self._start_worker(dry_run_override=True)
 
     @Slot()
@@ -372,22 +533,25 @@ class RenamerWindow(QMainWindow):
         self.dst_box.setEnabled(is_preserve)
         self.dst_box.setVisible(is_preserve)
         # 체크박스는 "다른 폴더" 모드일 때만 활성화
-        if hasattr(self, 'chk_preserve_folder_structure'):
-            self.chk_preserve_folder_structure.setEnabled(is_preserve)
+        if self._preserve_widget is not None:
+            self._preserve_widget.setEnabled(is_preserve)
         self._update_add_parent_folder_prefix_visibility()
 
     def _update_add_parent_folder_prefix_visibility(self) -> None:
         """상위 폴더 prefix 체크박스는 '저장 시 폴더 구조 유지' 해제 시에만 표시"""
-        if not hasattr(self, 'chk_add_parent_folder_prefix'):
+        if self._parent_prefix_widget is None:
             return
         is_other_folder = self.combo_output_mode.currentIndex() == 1
-        structure_preserved = self.chk_preserve_folder_structure.isChecked() if hasattr(self, 'chk_preserve_folder_structure') else True
-        self.chk_add_parent_folder_prefix.setVisible(is_other_folder and not structure_preserved)
-        self.chk_add_parent_folder_prefix.setEnabled(is_other_folder and not structure_preserved)
+        structure_preserved = self._preserve_widget.isChecked() if self._preserve_widget is not None else True
+        self._parent_prefix_widget.setVisible(is_other_folder and not structure_preserved)
+        self._parent_prefix_widget.setEnabled(is_other_folder and not structure_preserved)
 
     def _update_rename_mode(self) -> None:
         """이름 변경 모드에 따른 UI 업데이트"""
-        rename_modes = self.constants.get('rename_modes', {}).get('display', [])
+        # 미리보기/검증에서 사용할 파일명 생성 방식은 모드가 바뀔 때만 결정
+        rename_method = self._rename_modes_mapping.get(self.combo_rename_mode.currentText(), 'build_new_name')
+        self._keep_name = rename_method == "build_keep_name"
+        rename_modes = self._rename_modes_display
         is_new_rule = self.combo_rename_mode.currentText() == rename_modes[0] if rename_modes else True
         # 새로운 규칙으로 변경 시에만 인덱스 관련 컨트롤 활성화
         self.combo_index_base.setEnabled(is_new_rule)
@@ -396,98 +560,207 @@ class RenamerWindow(QMainWindow):
         self.spin_index_offset.setEnabled(is_new_rule)
         self.chk_reset_per_folder.setEnabled(is_new_rule)
 
+    def _make_build_func(self, pad_width: int, index_mul: float, index_offset: int, prefix: str, postfix: str):
+        """현재 모드의 파일명 생성 함수 (설정값은 미리 적용됨)
+
+        Returns:
+            build_keep_name 모드: build(stem, suffix)
+            그 외: build(index_value, suffix)
+        """
+        if self._keep_name:
+            return make_keep_name_builder(prefix, postfix)
+        return make_new_name_builder(pad_width, index_mul, index_offset, prefix, postfix)
+
     # ---------- Scan & Tree Highlight ----------
-    def _compute_pairs_for_ui(self, paths: list[Path]) -> list[tuple[Path, int]]:
-        """UI용 pairs 계산"""
-        index_base_display = self.combo_index_base.currentText()
-        base = self.constants.get('index_base_options', {}).get('mapping', {}).get(index_base_display, 1)
+    def _group_sorted(self, folder: Path, paths: list[str]) -> dict[str, list[Path]]:
+        """상대 부모 폴더별로 묶고 정렬한 그룹 (키 순서가 곧 표시/인덱스 순서)
         
-        # 폴더별로 그룹화 (동일 폴더 내 인덱스 매핑 우선)
+        paths는 folder로 시작하는 경로 문자열(list_files_fast 결과)이며,
+        상대 부모 폴더는 문자열 자르기로 구하고 Path는 그룹에 넣을 때만 만듭니다.
+        natural_sort_key는 경로마다 한 번만 계산해 전체를 정렬한 뒤 그 순서대로 묶으므로
+        각 그룹은 이미 정렬된 상태입니다.
+        """
+        root = os.fspath(folder)
+        prefix = root if root.endswith(os.sep) else root + os.sep
+        cut = len(prefix)
+        decorated = sorted(((natural_sort_key_str(os.path.basename(s)), s) for s in paths), key=itemgetter(0))
         groups: dict[str, list[Path]] = {}
-        folder = Path(self.edit_folder.text().strip())
-        for p in paths:
-            try:
-                rel_parent = p.parent.relative_to(folder)
-            except Exception:
-                rel_parent = Path("")
-            key = str(rel_parent)
-            groups.setdefault(key, []).append(p)
+        for _, s in decorated:
+            parent = os.path.dirname(s)
+            # 선택 폴더 바로 아래 파일은 str(Path(""))와 같은 "."
+            key = (parent[cut:] if parent.startswith(prefix) else "") or "."
+            groups.setdefault(key, []).append(Path(s))
+        return {key: groups[key] for key in sorted(groups.keys(), key=lambda s: s.lower())}
+
+    def _get_sorted_groups(self, folder: Path, pattern: str) -> dict[str, list[Path]]:
+        """스캔 결과 그룹 반환 (마지막 스캔과 폴더/패턴이 같으면 다시 읽지 않음)"""
+        cache = self._scan_cache
+        if cache.get("folder") == folder and cache.get("pattern") == pattern:
+            return cache["sorted_groups"]
+        paths = list_files_fast(folder, pattern, recursive=True)
+        sorted_groups = self._group_sorted(folder, paths)
+        self._scan_cache = {"folder": folder, "pattern": pattern, "sorted_groups": sorted_groups}
+        return sorted_groups
+
+    def _compute_pairs_for_ui(self, sorted_groups: dict[str, list[Path]]) -> list[tuple[Path, int]]:
+        """UI용 pairs 계산 (sorted_groups: _group_sorted 결과)"""
+        index_base_display = self.combo_index_base.currentText()
+        base = self._index_base_mapping.get(index_base_display, 1)
+        
+        if assign_indices is not None:
+            # 그룹 크기만 넘겨 인덱스 배열을 한 번에 계산
+            sizes = np.fromiter((len(g) for g in sorted_groups.values()), dtype=np.int64, count=len(sorted_groups))
+            indices = assign_indices(sizes, base, self.chk_reset_per_folder.isChecked())
+            flat = [p for group_paths in sorted_groups.values() for p in group_paths]
+            return list(zip(flat, indices.tolist()))
         
         pairs: list[tuple[Path, int]] = []
         if not self.chk_reset_per_folder.isChecked():
             # 폴더별로 먼저 처리하되, 인덱스는 연속적으로 유지
             current_index = base
-            for key in sorted(groups.keys(), key=lambda s: s.lower()):
-                group_paths = sorted(groups[key], key=natural_sort_key)
+            for group_paths in sorted_groups.values():
                 for gp in group_paths:
                     pairs.append((gp, current_index))
                     current_index += 1
         else:
             # 폴더별로 인덱스 초기화
-            for key in sorted(groups.keys(), key=lambda s: s.lower()):
-                group_paths = sorted(groups[key], key=natural_sort_key)
+            for group_paths in sorted_groups.values():
                 for idx, gp in enumerate(group_paths):
                     pairs.append((gp, idx + base))
         return pairs
 
     def _on_scan(self) -> None:
-        """파일 스캔"""
+        """파일 스캔 (목록 읽기는 별도 스레드에서 실행)"""
+        # 이름 변경 작업 중에는 스캔하지 않음 (작업이 끝나면 파일 목록이 바뀔 수 있음)
+        if self.scan_worker is not None or self.worker is not None:
+            return
         folder = Path(self.edit_folder.text().strip())
         pattern = self.edit_pattern.text().strip() or "*"
-        if not folder.exists() or not folder.is_dir():
+        if not folder.is_dir():
             QMessageBox.warning(self, "경고", "유효한 폴더를 선택하세요.")
             return
-        paths = list_files(folder, pattern, recursive=True)
-        self._populate_tree(paths)
+        
+        self._set_running(True)
+        self.btn_scan.setEnabled(False)
+        self.scan_worker = ScanWorker(folder, pattern)
+        self.scan_worker.finished.connect(self._on_scan_finished)
+        self.scan_worker.failed.connect(self._on_scan_failed)
+        self._pool.start(RenamerRunnable(self.scan_worker))
+
+    @Slot(list)
+    def _on_scan_finished(self, paths: list[str]) -> None:
+        """스캔 완료: 트리 표시"""
+        folder, pattern = self.scan_worker.folder, self.scan_worker.pattern
+        self._cleanup_scan_worker()
+        sorted_groups = self._group_sorted(folder, paths)
+        self._scan_cache = {"folder": folder, "pattern": pattern, "sorted_groups": sorted_groups}
+        self._populate_tree(sorted_groups)
         self._highlight_tree()
-        self._populate_current_structure_tree(paths)
+        # 정렬된 그룹을 펼쳐 넘기면 폴더별 파일이 이미 정렬된 순서로 들어감
+        self._populate_current_structure_tree([p for group_paths in sorted_groups.values() for p in group_paths])
 
-    def _populate_tree(self, paths: list[Path]) -> None:
-        """트리 위젯에 파일 목록 표시"""
-        self.tree.clear()
-        folder = Path(self.edit_folder.text().strip())
-        groups: dict[str, list[Path]] = {}
-        for p in paths:
-            try:
-                rel_parent = p.parent.relative_to(folder)
-            except Exception:
-                rel_parent = Path("")
-            key = str(rel_parent)
-            groups.setdefault(key, []).append(p)
-        
+    @Slot(str)
+    def _on_scan_failed(self, msg: str) -> None:
+        """스캔 실패"""
+        self.log.appendPlainText(f"스캔 오류: {msg}")
+        self._cleanup_scan_worker()
+
+    def _cleanup_scan_worker(self) -> None:
+        """스캔 Worker 정리 (스레드는 풀에서 재사용)"""
+        self.scan_worker = None
+        self.btn_scan.setEnabled(True)
+        self._set_running(False)
+
+    def _populate_tree(self, sorted_groups: dict[str, list[Path]]) -> None:
+        """트리 위젯에 파일 목록 표시 (sorted_groups: _group_sorted 결과)"""
         # index_base 매핑
         index_base_display = self.combo_index_base.currentText()
-        base = self.constants.get('index_base_options', {}).get('mapping', {}).get(index_base_display, 1)
+        base = self._index_base_mapping.get(index_base_display, 1)
         
-        for key in sorted(groups.keys(), key=lambda s: s.lower()):
-            parent_item = QTreeWidgetItem(["", key if key else ".", ""])
-            self.tree.addTopLevelItem(parent_item)
-            for idx, p in enumerate(sorted(groups[key], key=natural_sort_key)):
+        # 트리에 붙이지 않은 상태로 항목을 모두 만든 뒤 한 번에 추가
+        top_items: list[QTreeWidgetItem] = []
+        file_items: list[QTreeWidgetItem] = []
+        indices: list[int] = []
+        for key, group_paths in sorted_groups.items():
+            label = key if key else "."
+            parent_item = QTreeWidgetItem(["", label, ""])
+            children: list[QTreeWidgetItem] = []
+            for idx, p in enumerate(group_paths):
                 i = idx + base
-                child = QTreeWidgetItem([str(i), key if key else ".", p.name])
+                child = QTreeWidgetItem([str(i), label, p.name])
                 child.setData(0, Qt.UserRole, i)
                 child.setData(1, Qt.UserRole, str(p))
-                parent_item.addChild(child)
-            parent_item.setExpanded(True)
+                children.append(child)
+                indices.append(i)
+            parent_item.addChildren(children)
+            top_items.append(parent_item)
+            file_items.extend(children)
+        
+        # 새 항목은 _HIGHLIGHT_ROLE 값이 없으므로 모두 선택되지 않은 상태로 시작
+        self._tree_items = file_items
+        if np is not None:
+            self._tree_indices = np.array(indices, dtype=np.int64)
+            self._prev_selected = np.zeros(len(indices), dtype=bool)
+        else:
+            self._tree_indices = indices
+            self._prev_selected = [False] * len(indices)
+        
+        with _batch_tree_update(self.tree):
+            self.tree.clear()
+            self.tree.addTopLevelItems(top_items)
+            # setExpanded는 트리에 추가된 항목에만 적용되므로 추가 후 펼침
+            self.tree.expandAll()
 
     def _highlight_tree(self) -> None:
-        """트리 항목 하이라이트"""
+        """트리 항목 하이라이트
+        
+        선택 여부를 한 번에 계산하고, 이전 상태와 달라진 항목만 _HIGHLIGHT_ROLE 값을 바꿉니다.
+        """
+        items = self._tree_items
+        if not items:
+            return
         apply_sel = self.chk_apply_selection.isChecked()
         sel_off = int(self.spin_sel_offset.value())
         sel_div = int(self.spin_sel_div.value())
-        hl_brush = QBrush(QColor(255, 255, 200))
-        normal_brush = QBrush()
-        for t in range(self.tree.topLevelItemCount()):
-            parent_item = self.tree.topLevelItem(t)
-            for c in range(parent_item.childCount()):
-                item = parent_item.child(c)
-                i = int(item.data(0, Qt.UserRole) or 0)
-                selected = apply_sel and sel_div > 0 and ((i - sel_off) % sel_div == 0)
-                for col in range(3):
-                    item.setBackground(col, hl_brush if selected else normal_brush)
+        active = apply_sel and sel_div > 0
+        prev = self._prev_selected
+        
+        if np is not None:
+            if active and selection_mask is not None:
+                mask = selection_mask(self._tree_indices, sel_off, sel_div)
+            elif active:
+                mask = (self._tree_indices - sel_off) % sel_div == 0
+            else:
+                mask = np.zeros(len(items), dtype=bool)
+            changed = np.flatnonzero(mask != prev).tolist()
+            selected = mask.tolist()
+        else:
+            if active:
+                mask = [(i - sel_off) % sel_div == 0 for i in self._tree_indices]
+            else:
+                mask = [False] * len(items)
+            changed = [k for k, (now, before) in enumerate(zip(mask, prev)) if now != before]
+            selected = mask
+        self._prev_selected = mask
+        
+        if not changed:
+            return
+        # 바뀐 항목마다 다시 그리기가 예약되지 않도록 갱신을 멈춘 뒤 한 번에 다시 그림
+        self.tree.setUpdatesEnabled(False)
+        try:
+            for k in changed:
+                items[k].setData(0, _HIGHLIGHT_ROLE, selected[k])
+        finally:
+            self.tree.setUpdatesEnabled(True)
+        # dataChanged는 0번 열에만 발생하므로 나머지 열도 다시 그리도록 요청
+        self.tree.viewport().update()
 
     def _on_selection_changed(self) -> None:
-        """선택 규칙 변경 시 트리 업데이트"""
+        """선택 규칙 변경 시 트리 업데이트 예약 (80ms 안의 변경은 한 번으로 합침)"""
+        self._refresh_timer.start()
+
+    def _do_selection_refresh(self) -> None:
+        """선택 규칙에 맞춰 트리 하이라이트와 미리보기 갱신"""
         if self.tree.topLevelItemCount() == 0:
             self._on_scan()
             return
@@ -495,222 +768,203 @@ class RenamerWindow(QMainWindow):
         self._update_preview_tree()
     
     def _populate_current_structure_tree(self, paths: list[Path]) -> None:
-        """현재 폴더 구조를 트리로 표시"""
+        """현재 폴더 구조를 트리로 표시 (paths: 폴더별로 이미 정렬된 파일 목록)"""
         if not hasattr(self, 'tree_current_structure'):
             return
         
-        self.tree_current_structure.clear()
         folder = Path(self.edit_folder.text().strip())
         
-        # 폴더 구조를 트리로 구성
-        folder_tree: dict[str, dict] = {}
-        file_tree: dict[str, list[Path]] = {}
+        # 폴더 구조를 트리로 구성 (폴더 경로는 parts 튜플로 다룸, 루트는 ())
+        folder_tree: set[tuple[str, ...]] = set()
+        file_tree: dict[tuple[str, ...], list[Path]] = {}
         
+        rel_parent_of = _rel_parent_getter(folder)
         for p in paths:
-            try:
-                rel_path = p.relative_to(folder)
-            except Exception:
-                continue
-            
-            # 폴더 경로 분리
-            parts = rel_path.parts
-            if len(parts) == 1:
-                # 루트에 있는 파일
-                file_tree.setdefault("", []).append(p)
-            else:
-                # 하위 폴더에 있는 파일
-                folder_path = "/".join(parts[:-1])
-                file_tree.setdefault(folder_path, []).append(p)
-                
-                # 중간 폴더들 추가
-                current_path = ""
-                for part in parts[:-1]:
-                    if current_path:
-                        current_path = f"{current_path}/{part}"
-                    else:
-                        current_path = part
-                    if current_path not in folder_tree:
-                        folder_tree[current_path] = {}
-        
-        # 트리 아이템 생성
-        def create_folder_item(folder_path: str, parent_item: QTreeWidgetItem | None = None) -> QTreeWidgetItem:
-            """폴더 아이템 생성"""
-            folder_name = folder_path.split("/")[-1] if "/" in folder_path else folder_path
-            if parent_item:
-                item = QTreeWidgetItem(parent_item, [folder_name])
-            else:
-                item = QTreeWidgetItem(self.tree_current_structure, [folder_name])
-            item.setExpanded(True)
-            return item
+            folder_parts = rel_parent_of(p).parts
+            file_tree.setdefault(folder_parts, []).append(p)
+            # 중간 폴더들 추가
+            for i in range(1, len(folder_parts) + 1):
+                folder_tree.add(folder_parts[:i])
+        
+        # 트리에 붙이지 않은 상태로 항목을 모두 만든 뒤 한 번에 추가
+        top_items: list[QTreeWidgetItem] = []
+        path_to_item: dict[tuple[str, ...], QTreeWidgetItem] = {}  # 폴더 parts -> 아이템
         
         # 루트 파일들 추가
-        if "" in file_tree:
-            root_item = QTreeWidgetItem(self.tree_current_structure, ["."])
-            root_item.setExpanded(True)
-            for p in sorted(file_tree[""], key=natural_sort_key):
-                file_item = QTreeWidgetItem(root_item, [p.name])
+        if () in file_tree:
+            root_item = QTreeWidgetItem(["."])
+            root_item.addChildren([QTreeWidgetItem([p.name]) for p in file_tree[()]])
+            top_items.append(root_item)
         
         # 폴더별로 정렬하여 추가
-        for folder_path in sorted(folder_tree.keys(), key=lambda s: s.lower()):
-            parts = folder_path.split("/")
-            parent_item = None
-            current_path = ""
-            
-            for part in parts:
-                if current_path:
-                    current_path = f"{current_path}/{part}"
-                else:
-                    current_path = part
-                
-                # 이미 존재하는지 확인
-                found = False
-                if parent_item:
-                    for i in range(parent_item.childCount()):
-                        if parent_item.child(i).text(0) == part:
-                            parent_item = parent_item.child(i)
-                            found = True
-                            break
-                else:
-                    for i in range(self.tree_current_structure.topLevelItemCount()):
-                        if self.tree_current_structure.topLevelItem(i).text(0) == part:
-                            parent_item = self.tree_current_structure.topLevelItem(i)
-                            found = True
-                            break
-                
-                if not found:
-                    parent_item = create_folder_item(current_path, parent_item)
-            
+        for folder_parts in sorted(folder_tree, key=_parts_sort_key):
+            parent_item = _folder_item(folder_parts, path_to_item, top_items)
             # 해당 폴더의 파일들 추가
-            if folder_path in file_tree:
-                for p in sorted(file_tree[folder_path], key=natural_sort_key):
-                    file_item = QTreeWidgetItem(parent_item, [p.name])
+            if folder_parts in file_tree:
+                parent_item.addChildren([QTreeWidgetItem([p.name]) for p in file_tree[folder_parts]])
+        
+        with _batch_tree_update(self.tree_current_structure):
+            self.tree_current_structure.clear()
+            self.tree_current_structure.addTopLevelItems(top_items)
+            self.tree_current_structure.expandAll()
     
     def _update_preview_tree(self) -> None:
         """미리보기 트리 업데이트"""
         if not hasattr(self, 'tree_preview_structure'):
             return
         
-        self.tree_preview_structure.clear()
-        
         # 검증
         validated = self._validate()
         if not validated:
+            self._clear_preview_tree()
             return
         
-        folder, pattern, rename_method, index_base, pad_width, index_mul, index_offset, prefix, postfix, apply_selection, sel_offset, sel_division, reset_per_folder, preserve_tree, preserve_folder_structure, add_parent_folder_prefix, dest_root, move, overwrite, dry_run, verbose = validated
+        folder, pattern, rename_method, index_base, pad_width, index_mul, index_offset, prefix, postfix, apply_selection, sel_offset, sel_division, reset_per_folder, preserve_tree, preserve_folder_structure, add_parent_folder_prefix, dest_root, move, overwrite, dry_run, verbose, preserve_meta = validated
         
-        # 파일 목록 가져오기
-        paths = list_files(folder, pattern, recursive=True)
-        if not paths:
+        # 파일 목록 가져오기 (스캔 결과 재사용)
+        sorted_groups = self._get_sorted_groups(folder, pattern)
+        if not sorted_groups:
+            self._clear_preview_tree()
             return
         
         # pairs 계산
-        pairs = self._compute_pairs_for_ui(paths)
+        pairs = self._compute_pairs_for_ui(sorted_groups)
         if apply_selection and sel_division and sel_division > 0:
             pairs = [(p, i) for (p, i) in pairs if (i - sel_offset) % sel_division == 0]
         
-        # 파일명 생성 함수 가져오기
-        if rename_method == "build_keep_name":
-            build_func = build_keep_name
+        # 파일명은 한 번에 생성 (현재 이름 유지: 문자열 연결만, 새 규칙: 인덱스 일괄 계산)
+        if self._keep_name:
+            build_func = make_keep_name_builder(prefix, postfix)
+            new_names = [build_func(src.stem, src.suffix) for src, _ in pairs]
         else:
-            build_func = build_new_name
+            new_bases = build_new_names_bulk(
+                (i for _, i in pairs), "", pad_width, index_mul, index_offset, prefix, postfix
+            )
+            new_names = [base + src.suffix for base, (src, _) in zip(new_bases, pairs)]
         
-        # 목적지 경로 계산
-        preview_data: dict[str, list[tuple[str, str]]] = {}  # folder_path -> [(old_name, new_name)]
+        # 목적지 경로 계산 (폴더 경로는 parts 튜플, 루트는 ())
+        preview_data: dict[tuple[str, ...], list[tuple[Path, str]]] = {}  # folder_parts -> [(src, new_name)]
+        flatten = preserve_tree and dest_root is not None and not preserve_folder_structure
         
-        for src, index_value in pairs:
-            suffix = src.suffix
-            
-            if rename_method == "build_keep_name":
-                new_name = build_func(src.stem, suffix, prefix, postfix)
-            else:
-                new_name = build_func(index_value, suffix, pad_width, index_mul, index_offset, prefix, postfix)
+        rel_parent_of = _rel_parent_getter(folder)
+        for (src, _), new_name in zip(pairs, new_names):
+            rel_parent = rel_parent_of(src)
             
             # 상위 폴더 이름을 prefix로 추가 (이름 변경 모드와 독립)
-            if preserve_tree and dest_root is not None and not preserve_folder_structure and add_parent_folder_prefix:
-                try:
-                    rel_parent = src.parent.relative_to(folder)
-                except Exception:
-                    rel_parent = Path("")
+            if flatten and add_parent_folder_prefix:
                 prefix_str = build_parent_folder_prefix(rel_parent)
                 if prefix_str:
                     new_name = f"{prefix_str}_{new_name}"
             
-            # 목적지 경로 결정
-            if preserve_tree and dest_root is not None:
-                if preserve_folder_structure:
-                    try:
-                        rel_parent = src.parent.relative_to(folder)
-                    except Exception:
-                        rel_parent = Path("")
-                    dest_folder = str(rel_parent).replace("\\", "/") if str(rel_parent) else "."
-                else:
-                    dest_folder = "."
-            else:
-                try:
-                    rel_parent = src.parent.relative_to(folder)
-                except Exception:
-                    rel_parent = Path("")
-                dest_folder = str(rel_parent).replace("\\", "/") if str(rel_parent) else "."
-            
-            preview_data.setdefault(dest_folder, []).append((src.name, new_name))
+            # 목적지 경로 결정 (폴더 구조 무시 시 모두 루트)
+            dest_parts = () if flatten else rel_parent.parts
+            preview_data.setdefault(dest_parts, []).append((src, new_name))
         
-        # 트리 구성
-        def create_preview_folder_item(folder_path: str, parent_item: QTreeWidgetItem | None = None) -> QTreeWidgetItem:
-            """미리보기 폴더 아이템 생성"""
-            if folder_path == ".":
-                folder_name = dest_root.name if dest_root else "."
-            else:
-                folder_name = folder_path.split("/")[-1] if "/" in folder_path else folder_path
-            
-            if parent_item:
-                item = QTreeWidgetItem(parent_item, [folder_name])
-            else:
-                item = QTreeWidgetItem(self.tree_preview_structure, [folder_name])
-            item.setExpanded(True)
-            return item
+        root_name = dest_root.name if (preserve_tree and dest_root) else "."
+        self._show_preview(preview_data, root_name)
+
+    @Slot(list)
+    def _render_preview_from_plan(self, plan: list) -> None:
+        """Worker가 dry-run에서 계산한 결과로 미리보기 트리 갱신 (이름/경로 재계산 없음)"""
+        if not hasattr(self, 'tree_preview_structure'):
+            return
+        preview_data: dict[tuple[str, ...], list[tuple[Path, str]]] = {}
+        for src, new_name, dest_parts in plan:
+            preview_data.setdefault(dest_parts, []).append((src, new_name))
+        self._show_preview(preview_data, self._plan_root_name)
+
+    def _show_preview(self, preview_data: dict[tuple[str, ...], list[tuple[Path, str]]], root_name: str) -> None:
+        """preview_data를 미리보기 트리에 반영"""
+        if preview_data.keys() == self._preview_folders_with_files and root_name == self._preview_root_name:
+            # 폴더 구성이 같으면 바뀐 파일 항목만 갱신
+            self._apply_preview_diff(preview_data)
+        else:
+            self._rebuild_preview_tree(preview_data, root_name)
+
+    def _clear_preview_tree(self) -> None:
+        """미리보기 트리와 항목 인덱스 비우기"""
+        self.tree_preview_structure.clear()
+        self._preview_index = {}
+        self._preview_folders = {}
+        self._preview_folders_with_files = set()
+        self._preview_root_name = None
+
+    def _rebuild_preview_tree(self, preview_data: dict[tuple[str, ...], list[tuple[Path, str]]], root_name: str) -> None:
+        """미리보기 트리를 처음부터 구성하고 항목 인덱스를 기록"""
+        # 트리에 붙이지 않은 상태로 항목을 모두 만든 뒤 한 번에 추가
+        top_items: list[QTreeWidgetItem] = []
+        path_to_item: dict[tuple[str, ...], QTreeWidgetItem] = {}  # 폴더 parts -> 아이템
+        if () in preview_data:
+            path_to_item[()] = QTreeWidgetItem([root_name])
+            top_items.append(path_to_item[()])
         
-        # 루트 파일들 추가
-        if "." in preview_data:
-            root_name = dest_root.name if (preserve_tree and dest_root) else "."
-            root_item = QTreeWidgetItem(self.tree_preview_structure, [root_name])
-            root_item.setExpanded(True)
-            for old_name, new_name in sorted(preview_data["."], key=lambda x: x[1]):
-                file_item = QTreeWidgetItem(root_item, [new_name])
+        # 폴더별로 정렬하여 추가 (루트 파일이 먼저)
+        index: dict[tuple[tuple[str, ...], Path], QTreeWidgetItem] = {}
+        for folder_parts in sorted(preview_data.keys(), key=_parts_sort_key):
+            parent_item = _folder_item(folder_parts, path_to_item, top_items)
+            children: list[QTreeWidgetItem] = []
+            for src, new_name in sorted(preview_data[folder_parts], key=lambda x: x[1]):
+                item = QTreeWidgetItem([new_name])
+                index[(folder_parts, src)] = item
+                children.append(item)
+            parent_item.addChildren(children)
         
-        # 폴더별로 정렬하여 추가
-        for folder_path in sorted([f for f in preview_data.keys() if f != "."], key=lambda s: s.lower()):
-            parts = folder_path.split("/")
-            parent_item = None
-            current_path = ""
+        with _batch_tree_update(self.tree_preview_structure):
+            self.tree_preview_structure.clear()
+            self.tree_preview_structure.addTopLevelItems(top_items)
+            self.tree_preview_structure.expandAll()
+        
+        self._preview_index = index
+        self._preview_folders = path_to_item
+        self._preview_folders_with_files = set(preview_data.keys())
+        self._preview_root_name = root_name
+
+    def _apply_preview_diff(self, preview_data: dict[tuple[str, ...], list[tuple[Path, str]]]) -> None:
+        """기존 미리보기 트리에 바뀐 파일명만 반영 (폴더 구성은 그대로인 경우)"""
+        index = self._preview_index
+        folders = self._preview_folders
+        new_entries = {
+            (folder_parts, src): new_name
+            for folder_parts, entries in preview_data.items()
+            for src, new_name in entries
+        }
+        changed_folders: set[tuple[str, ...]] = set()
+        
+        with _batch_tree_update(self.tree_preview_structure):
+            # 선택 규칙 변경 등으로 빠진 파일 제거
+            for key in index.keys() - new_entries.keys():
+                item = index.pop(key)
+                folders[key[0]].removeChild(item)
+                changed_folders.add(key[0])
             
-            for part in parts:
-                if current_path:
-                    current_path = f"{current_path}/{part}"
-                else:
-                    current_path = part
-                
-                # 이미 존재하는지 확인
-                found = False
-                if parent_item:
-                    for i in range(parent_item.childCount()):
-                        if parent_item.child(i).text(0) == part:
-                            parent_item = parent_item.child(i)
-                            found = True
-                            break
+            # 새로 들어온 파일 추가, 이름이 바뀐 파일만 setText
+            for key, new_name in new_entries.items():
+                item = index.get(key)
+                if item is None:
+                    item = QTreeWidgetItem([new_name])
+                    folders[key[0]].addChild(item)
+                    index[key] = item
+                elif item.text(0) != new_name:
+                    item.setText(0, new_name)
                 else:
-                    for i in range(self.tree_preview_structure.topLevelItemCount()):
-                        if self.tree_preview_structure.topLevelItem(i).text(0) == part:
-                            parent_item = self.tree_preview_structure.topLevelItem(i)
-                            found = True
-                            break
-                
-                if not found:
-                    parent_item = create_preview_folder_item(current_path, parent_item)
+                    continue
+                changed_folders.add(key[0])
             
-            # 해당 폴더의 파일들 추가
-            for old_name, new_name in sorted(preview_data[folder_path], key=lambda x: x[1]):
-                file_item = QTreeWidgetItem(parent_item, [new_name])
+            # 바뀐 폴더만 파일 항목을 새 파일명 순으로 다시 배치
+            # (_rebuild_preview_tree와 같이 파일이 먼저, 하위 폴더 항목은 그 뒤에 그대로 둠)
+            for folder_parts in changed_folders:
+                parent_item = folders[folder_parts]
+                subfolder_ids = {
+                    id(item) for parts, item in folders.items()
+                    if folder_parts and parts[:-1] == folder_parts
+                }
+                for i in range(parent_item.childCount() - 1, -1, -1):
+                    if id(parent_item.child(i)) not in subfolder_ids:
+                        parent_item.takeChild(i)
+                parent_item.insertChildren(0, [
+                    index[(folder_parts, src)]
+                    for src, _ in sorted(preview_data[folder_parts], key=lambda x: x[1])
+                ])
 
     @Slot(int, int)
     def _on_finished(self, ok: int, total: int) -> None:
@@ -731,42 +985,38 @@ class RenamerWindow(QMainWindow):
         self._set_running(False)
 
     def _cleanup_worker(self) -> None:
-        """Worker 정리"""
-        if self.thread and self.worker:
-            self.thread.quit()
-            self.thread.wait()
-        self.thread = None
+        """Worker 정리 (스레드는 풀에서 재사용)"""
+        if self._run_modifies_files:
+            # 파일이 바뀌었으므로 다음 미리보기에서 다시 스캔
+            self._scan_cache = {}
         self.worker = None
 
+    def closeEvent(self, event) -> None:
+        """작업 중에는 닫지 않음 (닫으면 결과를 받을 윈도우가 삭제됨)"""
+        if self.worker is not None or self.scan_worker is not None:
+            QMessageBox.warning(self, "경고", "작업이 진행 중입니다. 완료 후 닫아 주세요.")
+            event.ignore()
+            return
+        self._pool.waitForDone()
+        super().closeEvent(event)
+
     def _set_running(self, running: bool) -> None:
-        """실행 중 상태 설정"""
-        for w in [
-            self.edit_folder,
-            self.btn_browse,
-            self.edit_pattern,
-            self.combo_rename_mode,
-            self.combo_index_base,
-            self.edit_prefix,
-            self.edit_postfix,
-            self.spin_pad,
-            self.spin_index_mul,
-            self.spin_index_offset,
-            self.combo_output_mode,
-            self.edit_dst,
-            self.btn_dst_browse,
-            self.chk_move,
-            self.chk_overwrite,
-            self.chk_dry,
-            self.chk_verbose,
-            self.chk_reset_per_folder,
-            self.btn_preview,
-            self.btn_run,
-        ] + ([self.chk_preserve_folder_structure, self.chk_add_parent_folder_prefix] if hasattr(self, 'chk_preserve_folder_structure') and hasattr(self, 'chk_add_parent_folder_prefix') else []):
+        """실행 중 상태 설정 (스캔과 작업이 모두 끝났을 때만 다시 활성화)"""
+        if not running and (self.worker is not None or self.scan_worker is not None):
+            return
+        for w in self._running_widgets:
             w.setEnabled(not running)
+        if not running:
+            # 일괄 활성화로 켜진 인덱스 관련 컨트롤을 현재 이름 변경 모드에 맞게 되돌림
+            self._update_rename_mode()
 
 
 def main() -> None:
-    """독립 실행용 (테스트)"""
+    """독립 실행용 (테스트)
+    
+    큰 폴더를 자주 스캔/미리보기한다면 PyPy로 실행하는 것을 권장합니다
+    (`pypy3 -m tools.renamer.gui`, README_DEV.md 참고).
+    """
     app = QApplication(sys.argv)
     win = RenamerWindow()
     # Designer에서 설정한 윈도우 크기가 자동 적용됨
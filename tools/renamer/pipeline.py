@@ -1,27 +1,80 @@
 """Renamer 도구의 연산 Pipeline"""
 from __future__ import annotations
 
-import io
-from contextlib import redirect_stdout
+import errno
+import os
+import time
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
 
-from tools.common.file_utils import ensure_write, list_files
-from tools.common.path_utils import natural_sort_key
+from tools.common.file_utils import ensure_write_many, list_files_fast
+from tools.common.path_utils import natural_sort_key_str
 from tools.common.log_utils import get_tool_logger
 from tools.renamer.functions import (
-    build_new_name,
-    build_keep_name,
+    build_new_names_bulk,
+    make_keep_name_builder,
     build_parent_folder_prefix,
     validate_parent_folder_prefix,
 )
 
+# 선택 폴더 바로 아래 파일의 상대 경로
+_EMPTY_REL = Path("")
+
+# 진행 로그를 GUI로 보내는 간격 (파일 수)
+_LOG_FLUSH_EVERY = 500
+# 진행률 알림 최소 간격 (초, 파일 수 기준 단계에 도달하지 않았을 때)
+_PROGRESS_INTERVAL = 0.05
+
+# io_uring 일괄 rename 사용 조건 (Linux + liburing 설치 + 환경 변수로 명시적으로 켠 경우)
+_URING_ENV = "RENAMER_URING"
+_URING_MIN_COUNT = 256
+
+
+def _get_uring_batch_rename():
+    """io_uring 일괄 rename 함수 반환 (사용할 수 없으면 None)"""
+    if os.environ.get(_URING_ENV) != "1":
+        return None
+    try:
+        from tools.renamer._uring import batch_rename
+    except ImportError as e:
+        get_tool_logger("renamer").debug("io_uring rename not available, using os.rename: %s", str(e))
+        return None
+    return batch_rename
+
+
+class ScanWorker(QObject):
+    """파일 목록 스캔 Worker (폴더가 커도 GUI 스레드가 멈추지 않도록 별도 스레드에서 실행)
+    
+    정렬과 Path 변환은 GUI에서 그룹을 만들 때 하므로 경로 문자열 목록만 전달합니다.
+    """
+    finished = Signal(list)  # list[str] (정렬 안 됨)
+    failed = Signal(str)
+
+    def __init__(self, folder: Path, pattern: str) -> None:
+        super().__init__()
+        self.logger = get_tool_logger("renamer")
+        self.folder = folder
+        self.pattern = pattern
+
+    @Slot()
+    def run(self) -> None:
+        """스캔 실행"""
+        try:
+            paths = list_files_fast(self.folder, self.pattern, recursive=True)
+        except Exception as e:  # noqa: BLE001
+            self.logger.error("Scan failed: %s", str(e), exc_info=True)
+            self.failed.emit(str(e))
+            return
+        self.logger.debug("Scan found %d files matching pattern '%s'", len(paths), self.pattern)
+        self.finished.emit(paths)
+
 
 class RenamerWorker(QObject):
     """파일명 변경 작업을 처리하는 Worker (Pipeline)"""
     progressed = Signal(str)
     progress = Signal(int, int)  # current, total
+    plan_ready = Signal(list)  # dry-run 결과 [(src, new_name, 목적지 폴더 parts)]
     finished = Signal(int, int)
     failed = Signal(str)
 
@@ -48,6 +101,8 @@ class RenamerWorker(QObject):
         overwrite: bool,
         dry_run: bool,
         verbose: bool,
+        max_workers: int = 8,
+        preserve_meta: bool = True,
     ) -> None:
         super().__init__()
         self.logger = get_tool_logger("renamer")
@@ -72,14 +127,48 @@ class RenamerWorker(QObject):
         self.overwrite = overwrite
         self.dry_run = dry_run
         self.verbose = verbose
+        self.max_workers = max_workers  # 복사/이동 병렬 스레드 수
+        self.preserve_meta = preserve_meta  # False면 복사 시 파일 내용만 복사
 
     def _get_build_function(self):
-        """메서드명으로 파일명 생성 함수 반환"""
-        method_map = {
-            "build_new_name": build_new_name,
-            "build_keep_name": build_keep_name,
-        }
-        return method_map.get(self.rename_method, build_new_name)  # 기본값
+        """메서드명으로 파일명 생성 함수 반환 (설정값은 미리 적용됨)
+
+        Returns:
+            build_keep_name 모드: build(stem, suffix)
+            그 외 (build_new_name, 기본값): None (build_new_names_bulk로 일괄 생성)
+        """
+        if self.rename_method == "build_keep_name":
+            return make_keep_name_builder(self.prefix, self.postfix)
+        return None
+
+    def _rename_with_uring(self, jobs: list[tuple[str, str]], on_done) -> list[tuple[str, str]]:
+        """이동 작업을 io_uring으로 일괄 rename하고, 일반 경로로 다시 처리할 작업 목록 반환
+
+        사용할 수 없거나 파일 수가 적으면 jobs를 그대로 반환합니다.
+        다른 장치로의 이동(-EXDEV) 등 rename으로 끝나지 않은 항목만 남깁니다.
+        """
+        batch_rename = _get_uring_batch_rename() if len(jobs) >= _URING_MIN_COUNT else None
+        if batch_rename is None:
+            return jobs
+
+        for parent in {os.path.dirname(dst) for _, dst in jobs}:
+            os.makedirs(parent, exist_ok=True)
+        try:
+            results = batch_rename(jobs, self.overwrite)
+        except OSError as e:
+            self.logger.debug("io_uring rename failed, using os.rename: %s", str(e))
+            return jobs
+
+        rest = []
+        for job, res in zip(jobs, results):
+            # 대상이 이미 있어 건너뛴 경우(-EEXIST)도 ensure_write와 같이 완료로 처리
+            if res == 0 or res == -errno.EEXIST:
+                on_done(*job)
+            else:
+                rest.append(job)
+        self.logger.debug("io_uring renamed %d files, %d left for fallback",
+                          len(jobs) - len(rest), len(rest))
+        return rest
 
     @Slot()
     def run(self) -> None:
@@ -88,14 +177,15 @@ class RenamerWorker(QObject):
             self.logger.info("Renaming task started: folder=%s, pattern=%s, method=%s", 
                            self.folder, self.pattern, self.rename_method)
             
-            if not self.folder.exists() or not self.folder.is_dir():
+            # stat 한 번으로 존재 여부와 폴더 여부를 함께 확인
+            if not os.path.isdir(self.folder):
                 error_msg = f"Invalid folder path: {self.folder}"
                 self.logger.error(error_msg)
                 self.failed.emit("폴더 경로가 유효하지 않습니다.")
                 return
 
-            # 범용 함수 사용
-            paths = list_files(self.folder, self.pattern, recursive=True)
+            # 경로 문자열 목록만 받고 (전체 정렬/Path 변환 없이) 폴더별로 묶은 뒤 폴더 안에서만 정렬
+            paths = list_files_fast(self.folder, self.pattern, recursive=True)
             self.logger.debug("Found %d files matching pattern '%s'", len(paths), self.pattern)
             
             if len(paths) == 0:
@@ -104,44 +194,69 @@ class RenamerWorker(QObject):
                 self.finished.emit(0, 0)
                 return
 
+            # 같은 폴더의 파일은 상대 경로가 같으므로 부모 폴더(경로 문자열)별로 한 번만 계산
+            # list_files_fast의 경로는 모두 root로 시작하므로 relative_to 대신 앞부분만 잘라냄
+            root = os.fspath(self.folder)
+            seps = os.sep + (os.altsep or "")
+            rel_cache: dict[str, Path] = {}
+
+            def rel_of(parent: str) -> Path:
+                rel = rel_cache.get(parent)
+                if rel is None:
+                    if parent.startswith(root):
+                        rel = Path(parent[len(root):].lstrip(seps))
+                    else:
+                        rel = _EMPTY_REL
+                    rel_cache[parent] = rel
+                return rel
+
             # 폴더별로 그룹화 (동일 폴더 내 인덱스 매핑 우선)
-            groups: dict[str, list[Path]] = {}
-            for p in paths:
-                try:
-                    rel_parent = p.parent.relative_to(self.folder)
-                except Exception:
-                    rel_parent = Path("")
-                key = str(rel_parent)
-                groups.setdefault(key, []).append(p)
+            by_dir: dict[str, list[str]] = {}
+            dirname = os.path.dirname
+            for path_str in paths:
+                by_dir.setdefault(dirname(path_str), []).append(path_str)
+            groups: dict[str, list[str]] = {}
+            for dir_str, files in by_dir.items():
+                groups.setdefault(str(rel_of(dir_str)), []).extend(files)
+
+            # 선택 규칙 ((i - offset) % division == 0)을 만족하는 인덱스는 등차수열이므로
+            # 모든 파일에 나머지 연산을 하지 않고 시작 위치와 간격으로 바로 잘라냄
+            select = self.apply_selection and self.sel_division and self.sel_division > 0
+            step = self.sel_division if select else 1
+            first = (self.sel_offset - self.index_base) % step
+
+            # 시작 위치가 (폴더별 초기화면 가장 큰 폴더의) 파일 수 이상이면 선택되는 파일이 없으므로
+            # 정렬과 이름 생성 준비 없이 바로 종료
+            span = max(map(len, groups.values())) if self.reset_per_folder else len(paths)
+            if first >= span:
+                self.logger.warning("No files to process after filtering")
+                self.finished.emit(0, 0)
+                return
+
+            basename = os.path.basename
+
+            def name_key(path_str: str) -> tuple:
+                return natural_sort_key_str(basename(path_str))
+
+            base = self.index_base
+            ordered_groups = [
+                sorted(groups[key], key=name_key)
+                for key in sorted(groups.keys(), key=lambda s: s.lower())
+            ]
 
-            pairs = []
             if not self.reset_per_folder:
                 # 폴더별로 먼저 처리하되, 인덱스는 연속적으로 유지
-                current_index = self.index_base
-                for key in sorted(groups.keys(), key=lambda s: s.lower()):
-                    group_paths = sorted(groups[key], key=natural_sort_key)
-                    for gp in group_paths:
-                        pairs.append((gp, current_index))
-                        current_index += 1
+                ordered = [gp for group_paths in ordered_groups for gp in group_paths]
+                pairs = list(zip(ordered[first::step], range(base + first, base + len(ordered), step)))
             else:
                 # 폴더별로 인덱스 초기화
-                for key in sorted(groups.keys(), key=lambda s: s.lower()):
-                    group_paths = sorted(groups[key], key=natural_sort_key)
-                    for idx, gp in enumerate(group_paths):
-                        i = idx + self.index_base
-                        pairs.append((gp, i))
-
-            # 선택 규칙 필터 적용
-            if self.apply_selection and self.sel_division and self.sel_division > 0:
-                original_count = len(pairs)
-                pairs = [ (p, i) for (p, i) in pairs if (i - self.sel_offset) % self.sel_division == 0 ]
-                self.logger.debug("Selection filter applied: %d -> %d files", 
-                                original_count, len(pairs))
+                pairs = []
+                for group_paths in ordered_groups:
+                    pairs.extend(zip(group_paths[first::step], range(base + first, base + len(group_paths), step)))
 
-            if len(pairs) == 0:
-                self.logger.warning("No files to process after filtering")
-                self.finished.emit(0, 0)
-                return
+            if select:
+                self.logger.debug("Selection filter applied: %d -> %d files", 
+                                len(paths), len(pairs))
 
             count_ok = 0
             count_total = len(pairs)
@@ -151,110 +266,271 @@ class RenamerWorker(QObject):
             # 초기 진행률 알림
             self.progress.emit(0, count_total)
 
-            # 파일명 생성 함수 가져오기
+            # 파일명 생성 함수 가져오기 (루프 밖에서 한 번만 구성)
             build_func = self._get_build_function()
+            keep_name = build_func is not None
+            if not keep_name:
+                # 새 규칙 이름은 확장자를 제외하고 한 번에 계산 (확장자는 파일별로 붙임)
+                new_bases = build_new_names_bulk(
+                    (i for _, i in pairs),
+                    "",
+                    self.pad_width,
+                    self.index_mul,
+                    self.index_offset,
+                    self.prefix,
+                    self.postfix,
+                )
+
+            # dry-run이면 미리보기 트리용 계획을 모아 전달 (GUI에서 같은 계산을 반복하지 않도록)
+            plan: list[tuple[Path, str, tuple[str, ...]]] | None = [] if self.dry_run else None
+            flatten = (
+                self.preserve_tree
+                and self.dest_root is not None
+                and not self.preserve_folder_structure
+            )
+
+            # 이름/경로 계산과 로그는 순서대로 처리하고, 실제 쓰기는 모아서 병렬 실행
+            # (루프 안에서는 Path를 만들지 않고 문자열과 os.path 함수로만 처리)
+            jobs: list[tuple[str, str]] = []
+
+            # 로그 줄은 리스트에 모아 로그 위젯으로 전달 (verbose/dry-run이 아니면 만들지 않음)
+            emit_log = self.verbose or self.dry_run
+            log_lines: list[str] = []
+            action = "move" if self.move else "copy"
+            exists_tag = "overwrite" if self.overwrite else "skip"
+            keep_dirs = (
+                self.preserve_tree
+                and self.dest_root is not None
+                and self.preserve_folder_structure
+            )
+            add_prefix = flatten and self.add_parent_folder_prefix
+
+            # 원본 폴더별로 한 번만 계산하는 값
+            # (상대 경로, 대상 폴더 경로 + 구분자, 로그용 원본 상대 폴더, 로그용 목적지 폴더 prefix, 상위 폴더 prefix)
+            parent_cache: dict[str, tuple[Path, str, str, str, str]] = {}
+
+            def parent_info(parent: str) -> tuple[Path, str, str, str, str]:
+                info = parent_cache.get(parent)
+                if info is None:
+                    rel = rel_of(parent)
+                    if keep_dirs:
+                        # 폴더 구조 유지: 상대 경로를 그대로 유지
+                        base_dir = self.dest_root / rel
+                    elif flatten:
+                        # 폴더 구조 무시: 모든 파일을 dest_root 루트에 저장
+                        base_dir = self.dest_root
+                    else:
+                        base_dir = parent
+                    if emit_log:
+                        # 로그는 "/" 구분자로 표시 (POSIX는 이미 "/"이므로 변환하지 않음)
+                        rel_dir_str = str(rel)
+                        if os.sep != "/":
+                            rel_dir_str = rel_dir_str.replace(os.sep, "/")
+                        # 폴더 구조 유지 여부에 따라 목적지 경로 표시 (구조 무시 시 루트에 저장)
+                        dest_dir_str = f"{rel_dir_str}/" if keep_dirs and rel_dir_str != "." else ""
+                    else:
+                        rel_dir_str = dest_dir_str = ""
+                    prefix_str = build_parent_folder_prefix(rel) if add_prefix else ""
+                    info = (rel, os.path.join(base_dir, ""), rel_dir_str, dest_dir_str, prefix_str)
+                    parent_cache[parent] = info
+                return info
+
+            # 로그의 기존 파일 여부는 대상 폴더마다 scandir 한 번으로 확인 (파일마다 stat 하지 않음)
+            # (쓰기는 루프가 끝난 뒤에 하므로 앞선 작업이 차지한 대상/옮긴 원본은 목록에 직접 반영)
+            normcase = os.path.normcase
+            existing_cache: dict[str, set[str]] = {}
+
+            def existing_in(dst_dir: str) -> set[str]:
+                names = existing_cache.get(dst_dir)
+                if names is None:
+                    try:
+                        with os.scandir(dst_dir) as it:
+                            names = {normcase(entry.name) for entry in it}
+                    except (FileNotFoundError, NotADirectoryError):
+                        names = set()
+                    existing_cache[dst_dir] = names
+                return names
+
+            # 루프 안에서 반복되는 속성 조회를 지역 변수로 미리 꺼냄
+            split = os.path.split
+            append_log = log_lines.append
+            append_job = jobs.append
+            emit_progressed = self.progressed.emit
+            # 덮어쓰기 복사에서 대상이 원본과 같은 파일(하드 링크, 대소문자만 다른 경로)이면 자기 자신에 복사하게 되므로 확인
+            # (이동은 rename이 같은 파일이면 아무것도 하지 않거나 대소문자만 바꾸므로 그대로 진행)
+            check_same = self.overwrite and not self.move
+
+            def samefile(a: str, b: str) -> bool:
+                # 앞선 작업이 차지했지만 아직 쓰지 않은 대상은 stat할 수 없으므로 다른 파일로 봄
+                try:
+                    return os.path.samefile(a, b)
+                except OSError:
+                    return False
+
+            # 실제 실행이면 파일을 하나씩 쓴 것처럼 목록을 갱신 (dry-run은 디스크 상태 그대로 표시)
+            track_claims = emit_log and not self.dry_run
+            # 실제 실행의 로그 줄은 쓰기가 끝난 뒤에 파일 순서대로 전달
+            # (병렬 쓰기도 순서가 일정하고, 중간에 실패하면 처리하지 않은 파일은 표시하지 않음)
+            pending_log: list[tuple[str, str]] = []  # (원본 경로, 로그 줄), 파일 순서
+            written: set[str] = set()  # 쓰기가 끝났지만 아직 로그로 내보내지 않은 원본 경로
+            next_log = 0
+            noops = 0
+            for k, (src, _) in enumerate(pairs):
+                src_dir, name = split(src)
+                # Path.stem / Path.suffix와 같은 규칙 (맨 앞 또는 맨 끝의 "."은 확장자로 보지 않음)
+                dot = name.rfind(".")
+                if 0 < dot < len(name) - 1:
+                    stem, suffix = name[:dot], name[dot:]
+                else:
+                    stem, suffix = name, ""
+                rel_parent, dst_base, rel_dir_str, dest_dir_str, prefix_str = parent_info(src_dir)
+                # 메서드명에 따라 적절한 함수 호출
+                if keep_name:
+                    # 현재 이름 유지 모드
+                    new_name = build_func(stem, suffix)
+                else:
+                    # 새로운 규칙으로 변경 모드 (기본값)
+                    new_name = new_bases[k] + suffix
+                
+                # 상위 폴더 이름을 prefix로 추가 (이름 변경 모드와 독립적으로 적용)
+                if add_prefix:
+                    ok, err = validate_parent_folder_prefix(rel_parent, new_name)
+                    if not ok:
+                        self.logger.error("Parent folder prefix validation failed: %s", err)
+                        self.failed.emit(err)
+                        return
+                    if prefix_str:
+                        new_name = f"{prefix_str}_{new_name}"
+                
+                dst = dst_base + new_name
+
+                # 이미 원하는 이름인 파일은 쓰기 없이 완료로 처리 (다시 실행할 때 시스템 콜 없음)
+                noop = src == dst or (
+                    check_same
+                    and normcase(new_name) in existing_in(dst_base)
+                    and samefile(src, dst)
+                )
+
+                # 로그: 선택 폴더 기준 상대 경로(모든 상위 폴더)와 목적지 상대 경로 표시
+                if emit_log:
+                    dest_rel_path = dest_dir_str + new_name
 
-            # 캡처하여 로그 위젯으로 전달
-            buf = io.StringIO()
-            with redirect_stdout(buf):
-                for src, index_value in pairs:
-                    suffix = src.suffix
-                    # 메서드명에 따라 적절한 함수 호출
-                    if self.rename_method == "build_keep_name":
-                        # 현재 이름 유지 모드
-                        new_name = build_func(
-                            src.stem,
-                            suffix,
-                            self.prefix,
-                            self.postfix,
-                        )
+                    if noop:
+                        tag = "noop"
                     else:
-                        # 새로운 규칙으로 변경 모드 (기본값)
-                        new_name = build_func(
-                            index_value,
-                            suffix,
-                            self.pad_width,
-                            self.index_mul,
-                            self.index_offset,
-                            self.prefix,
-                            self.postfix,
-                        )
-                    
-                    # 상위 폴더 이름을 prefix로 추가 (이름 변경 모드와 독립적으로 적용)
-                    if (
-                        self.preserve_tree
-                        and self.dest_root is not None
-                        and not self.preserve_folder_structure
-                        and self.add_parent_folder_prefix
-                    ):
-                        try:
-                            rel_parent = src.parent.relative_to(self.folder)
-                        except Exception:
-                            rel_parent = Path("")
-                        ok, err = validate_parent_folder_prefix(rel_parent, new_name)
-                        if not ok:
-                            self.logger.error("Parent folder prefix validation failed: %s", err)
-                            self.failed.emit(err)
-                            return
-                        prefix_str = build_parent_folder_prefix(rel_parent)
-                        if prefix_str:
-                            new_name = f"{prefix_str}_{new_name}"
-                    
-                    if self.preserve_tree and self.dest_root is not None:
-                        # 폴더 구조 유지 옵션에 따라 처리
-                        if self.preserve_folder_structure:
-                            # 폴더 구조 유지: 상대 경로를 그대로 유지
-                            try:
-                                rel_parent = src.parent.relative_to(self.folder)
-                            except Exception:
-                                rel_parent = Path("")
-                            dst_dir = self.dest_root / rel_parent
-                            dst = dst_dir / new_name
-                        else:
-                            # 폴더 구조 무시: 모든 파일을 dest_root 루트에 저장
-                            dst = self.dest_root / new_name
+                        tag = exists_tag if normcase(new_name) in existing_in(dst_base) else action
+                    line = f"[{tag}] {rel_dir_str} | {name} -> {dest_rel_path}"
+                    if track_claims:
+                        pending_log.append((src, line))
+                        if noop:
+                            # 쓸 것이 없으므로 이미 끝난 것으로 처리
+                            written.add(src)
                     else:
-                        dst = src.with_name(new_name)
-
-                    # 로그: 선택 폴더 기준 상대 경로(모든 상위 폴더)와 목적지 상대 경로 표시
-                    if self.verbose or self.dry_run:
-                        action = "move" if self.move else "copy"
-                        try:
-                            rel_parent_for_log = src.parent.relative_to(self.folder)
-                        except Exception:
-                            rel_parent_for_log = Path("")
-                        rel_dir_str = str(rel_parent_for_log).replace("\\", "/") or "."
-                        # 폴더 구조 유지 여부에 따라 목적지 경로 표시
-                        if self.preserve_tree and self.dest_root is not None and self.preserve_folder_structure:
-                            dest_rel_path = f"{rel_dir_str}/{new_name}" if rel_dir_str != "." else new_name
-                        else:
-                            # 폴더 구조 무시 시 루트에 저장
-                            dest_rel_path = new_name
-
-                        if dst.exists():
-                            if not self.overwrite:
-                                print(f"[skip] {rel_dir_str} | {src.name} -> {dest_rel_path}")
-                            else:
-                                print(f"[overwrite] {rel_dir_str} | {src.name} -> {dest_rel_path}")
-                        else:
-                            print(f"[{action}] {rel_dir_str} | {src.name} -> {dest_rel_path}")
-
-                    # 실제 쓰기 (범용 함수 사용)
-                    ensure_write(
-                        src,
-                        dst,
-                        move=self.move,
-                        overwrite=self.overwrite,
-                        dry_run=self.dry_run,
-                        verbose=False,
-                    )
-
-                    count_ok += 1
-                    self.progress.emit(count_ok, count_total)
-
-            text = buf.getvalue()
-            if text:
-                self.progressed.emit(text)
+                        append_log(line)
+
+                if plan is not None:
+                    if flatten:
+                        dest_parts = ()
+                    else:
+                        dest_parts = rel_parent.parts
+                    # 미리보기 트리는 원본 Path로 항목을 구분하므로 여기서만 Path 생성
+                    plan.append((Path(src), new_name, dest_parts))
+
+                if noop:
+                    noops += 1
+                else:
+                    append_job((src, dst))
+                    if track_claims:
+                        # 같은 대상으로 가는 이후 파일은 skip/overwrite로 표시되도록 함
+                        if self.move:
+                            existing_in(os.path.join(src_dir, "")).discard(normcase(name))
+                        existing_in(dst_base).add(normcase(new_name))
+
+                # 로그는 500개마다 모아서 전달 (대량 작업 중에도 로그 창이 갱신되도록)
+                if log_lines and (k + 1) % _LOG_FLUSH_EVERY == 0:
+                    emit_progressed("\n".join(log_lines) + "\n")
+                    log_lines.clear()
+
+            if log_lines:
+                self.progressed.emit("\n".join(log_lines) + "\n")
+                log_lines.clear()
+
+            # 실제 쓰기 (범용 함수 사용, 완료되는 대로 진행률 알림)
+            # 대상 경로가 겹치거나 다른 파일의 원본 경로와 같으면 처리 순서에 따라
+            # 결과가 달라지므로 그때는 순차 실행
+            # (Windows는 대소문자를 구분하지 않으므로 normcase로 비교)
+            dsts = {normcase(dst) for _, dst in jobs}
+            independent = len(dsts) == len(jobs) and dsts.isdisjoint(normcase(src) for src, _ in jobs)
+            workers = self.max_workers if independent else 1
+
+            # 진행률은 약 200단계로만 알림 (파일마다 스레드 간 시그널을 보내지 않도록)
+            # 파일이 커서 한 단계가 오래 걸리면 _PROGRESS_INTERVAL마다 한 번은 알림
+            emit_every = max(1, count_total // 200)
+            count_ok = last_count = noops
+            if noops:
+                self.progress.emit(count_ok, count_total)
+            last_time = time.monotonic()
+
+            def drain_log() -> None:
+                # 아직 끝나지 않은 첫 파일 앞까지의 로그 줄만 순서대로 내보냄
+                nonlocal next_log
+                while next_log < len(pending_log) and pending_log[next_log][0] in written:
+                    src, line = pending_log[next_log]
+                    written.discard(src)
+                    append_log(line)
+                    next_log += 1
+                if len(log_lines) >= _LOG_FLUSH_EVERY:
+                    emit_progressed("\n".join(log_lines) + "\n")
+                    log_lines.clear()
+
+            def on_done(src: str, dst: str) -> None:
+                nonlocal count_ok, last_count, last_time
+                count_ok += 1
+                if pending_log:
+                    written.add(src)
+                    drain_log()
+                if (
+                    count_ok - last_count < emit_every
+                    and count_ok != count_total
+                    and time.monotonic() - last_time < _PROGRESS_INTERVAL
+                ):
+                    return
+                self.progress.emit(count_ok, count_total)
+                last_count = count_ok
+                last_time = time.monotonic()
+
+            # 원본 폴더 안에서 이름만 바꾸면 대상 폴더가 이미 있으므로 폴더 생성(stat)을 생략
+            make_parents = keep_dirs or flatten
+            if pending_log:
+                # 맨 앞의 [noop] 줄은 쓰기를 기다리지 않고 전달
+                drain_log()
+            try:
+                if self.move and not self.dry_run and independent:
+                    # 같은 장치 안의 이동은 rename 요청을 한꺼번에 제출 (RENAMER_URING=1)
+                    rest = self._rename_with_uring(jobs, on_done)
+                    if rest is not jobs:
+                        # 대상 폴더는 io_uring 처리 전에 이미 생성함
+                        make_parents = False
+                    jobs = rest
+
+                ensure_write_many(
+                    jobs,
+                    move=self.move,
+                    overwrite=self.overwrite,
+                    dry_run=self.dry_run,
+                    verbose=False,
+                    max_workers=workers,
+                    on_done=on_done,
+                    preserve_meta=self.preserve_meta,
+                    make_parents=make_parents,
+                )
+            finally:
+                # 실패하더라도 끝난 파일의 로그는 전달
+                if log_lines:
+                    self.progressed.emit("\n".join(log_lines) + "\n")
+
+            if plan is not None:
+                self.plan_ready.emit(plan)
 
             self.logger.info("Task completed: %d/%d files processed successfully", 
                            count_ok, count_total)
@@ -264,6 +540,22 @@ class RenamerWorker(QObject):
             self.failed.emit(str(e))
 
 
+class RenamerRunnable(QRunnable):
+    """ScanWorker / RenamerWorker를 QThreadPool에서 실행하기 위한 QRunnable
+
+    스캔/미리보기/실행마다 QThread를 만들지 않고 스레드 풀의 스레드를 재사용합니다.
+    시그널은 GUI 스레드에 있는 worker 객체에서 발생하므로
+    연결된 슬롯은 자동으로 GUI 스레드에서 (queued) 호출됩니다.
+    """
+
+    def __init__(self, worker: ScanWorker | RenamerWorker) -> None:
+        super().__init__()
+        self.worker = worker
+
+    def run(self) -> None:
+        self.worker.run()
+
+
 # CLI 테스트 지원
 if __name__ == "__main__":
     import sys
@@ -293,11 +585,12 @@ if __name__ == "__main__":
     parser.add_argument('--overwrite', action='store_true', help='덮어쓰기')
     parser.add_argument('--dry-run', action='store_true', help='실제 작업 없이 미리보기')
     parser.add_argument('--verbose', action='store_true', help='상세 로그')
+    parser.add_argument('--no-preserve-meta', action='store_true', help='복사 시 메타데이터 제외 (내용만 복사)')
     
     args = parser.parse_args()
     
     folder = Path(args.folder)
-    if not folder.exists() or not folder.is_dir():
+    if not folder.is_dir():
         print(f"Error: 유효한 폴더가 아닙니다: {folder}")
         sys.exit(1)
     
@@ -332,6 +625,7 @@ if __name__ == "__main__":
         overwrite=args.overwrite,
         dry_run=args.dry_run,
         verbose=args.verbose,
+        preserve_meta=not args.no_preserve_meta,
     )
     
     # 시그널 연결